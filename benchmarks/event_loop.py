@@ -0,0 +1,152 @@
+"""
+Compare uvicorn event loop and HTTP parser implementations.
+
+Starts a service with every combination of loop and HTTP parser
+and measures throughput and latency of ``/health`` and ``/health/db``
+over keep-alive connections. The database must be running.
+
+Usage::
+
+    python benchmarks/event_loop.py --service operation --requests 20000
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+PATHS = ("/health", "/health/db")
+LOOPS = ("asyncio", "uvloop")
+PARSERS = ("h11", "httptools")
+
+
+async def _fetch(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    request: bytes,
+) -> None:
+    writer.write(request)
+    await writer.drain()
+    headers = await reader.readuntil(b"\r\n\r\n")
+    if not headers.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(headers.split(b"\r\n", 1)[0].decode())
+    length = 0
+    for line in headers.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+
+
+async def _worker(
+    port: int,
+    request: bytes,
+    count: int,
+    latencies: List[float],
+) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(count):
+            started_at = time.perf_counter()
+            await _fetch(reader, writer, request)
+            latencies.append(time.perf_counter() - started_at)
+    finally:
+        writer.close()
+
+
+async def run_load(
+    port: int,
+    path: str,
+    requests: int,
+    connections: int,
+) -> Tuple[float, List[float]]:
+    """
+    Send requests over keep-alive connections.
+
+    :param port: port of the service.
+    :param path: requested path.
+    :param requests: total number of requests.
+    :param connections: number of concurrent connections.
+    :return: requests per second and latencies in seconds.
+    """
+    request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    latencies: List[float] = []
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _worker(port, request, requests // connections, latencies)
+            for _ in range(connections)
+        ),
+    )
+    return len(latencies) / (time.perf_counter() - started_at), latencies
+
+
+async def _wait_ready(port: int, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.5)
+            continue
+        try:
+            await _fetch(reader, writer, b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n")
+            return
+        finally:
+            writer.close()
+    raise TimeoutError("Service did not start.")
+
+
+def main() -> None:
+    """Run benchmark for every loop and parser combination."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--service",
+        choices=("auth", "operation"),
+        default="operation",
+    )
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--connections", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'loop':<8} {'http':<10} {'path':<11} "
+        f"{'rps':>9} {'p50 ms':>8} {'p99 ms':>8}",
+    )
+    for loop, http in itertools.product(LOOPS, PARSERS):
+        env = {
+            **os.environ,
+            "SIMPLE_TRANSACTIONS_PORT": str(args.port),
+            "SIMPLE_TRANSACTIONS_LOOP": loop,
+            "SIMPLE_TRANSACTIONS_HTTP": http,
+            "SIMPLE_TRANSACTIONS_LOG_LEVEL": "WARNING",
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", f"simple_transactions.{args.service}"],
+            env=env,
+        )
+        try:
+            asyncio.run(_wait_ready(args.port))
+            for path in PATHS:
+                rps, latencies = asyncio.run(
+                    run_load(args.port, path, args.requests, args.connections),
+                )
+                percentiles = statistics.quantiles(latencies, n=100)
+                print(
+                    f"{loop:<8} {http:<10} {path:<11} {rps:>9.0f} "
+                    f"{percentiles[49] * 1000:>8.2f} {percentiles[98] * 1000:>8.2f}",
+                )
+        except Exception as exc:
+            print(f"{loop:<8} {http:<10} failed: {exc}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measure request coalescing on a burst of identical reads.
+
+Simulates a connection pool with a fixed number of connections
+and a query with fixed latency, then sends a burst of concurrent
+requests for one key with and without single-flight.
+
+Usage::
+
+    python benchmarks/single_flight.py --burst 1000 --pool-size 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from simple_transactions.operation.services.single_flight import SingleFlight
+
+
+class FakePool:
+    """Connection pool where every query holds a connection for ``latency``."""
+
+    def __init__(self, size: int, latency: float) -> None:
+        self.latency = latency
+        self.queries = 0
+        self._connections = asyncio.Semaphore(size)
+
+    async def query(self) -> int:
+        """
+        Run a query.
+
+        :return: query result.
+        """
+        async with self._connections:
+            self.queries += 1
+            await asyncio.sleep(self.latency)
+        return 42
+
+
+async def _burst(size: int, read: Callable[[], Awaitable[int]]) -> List[float]:
+    async def timed() -> float:
+        started_at = time.perf_counter()
+        await read()
+        return time.perf_counter() - started_at
+
+    return await asyncio.gather(*(timed() for _ in range(size)))
+
+
+def _report(name: str, latencies: List[float], elapsed: float, queries: int) -> None:
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<14} {elapsed * 1000:>9.1f} {queries:>8} "
+        f"{percentiles[49] * 1000:>8.2f} {percentiles[98] * 1000:>8.2f}",
+    )
+
+
+async def run(burst: int, pool_size: int, latency: float) -> None:
+    """
+    Run the burst with and without coalescing.
+
+    :param burst: number of concurrent requests.
+    :param pool_size: number of pool connections.
+    :param latency: query latency in seconds.
+    """
+    print(f"{'mode':<14} {'wall ms':>9} {'queries':>8} {'p50 ms':>8} {'p99 ms':>8}")
+
+    pool = FakePool(pool_size, latency)
+    started_at = time.perf_counter()
+    latencies = await _burst(burst, pool.query)
+    _report("direct", latencies, time.perf_counter() - started_at, pool.queries)
+
+    pool = FakePool(pool_size, latency)
+    flight: SingleFlight[int] = SingleFlight("benchmark")
+    started_at = time.perf_counter()
+    latencies = await _burst(burst, lambda: flight.do("account:1", pool.query))
+    elapsed = time.perf_counter() - started_at
+    _report("single-flight", latencies, elapsed, pool.queries)
+    print(f"coalescing ratio: {flight.stats()['coalescing_ratio']:.3f}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--burst", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    asyncio.run(run(args.burst, args.pool_size, args.latency))
+
+
+if __name__ == "__main__":
+    main()
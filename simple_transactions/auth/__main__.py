@@ -11,6 +11,11 @@ def main() -> None:
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        loop=settings.loop.value,
+        http=settings.http.value,
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.timeout_keep_alive,
+        limit_concurrency=settings.limit_concurrency,
         log_level=settings.log_level.value.lower(),
         factory=True,
     )
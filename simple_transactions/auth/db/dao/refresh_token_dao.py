@@ -0,0 +1,234 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from simple_transactions.auth.db.models.refresh_token import RefreshTokenModel
+
+PARTITION_PREFIX = f"{RefreshTokenModel.__tablename__}_p"
+PARTITION_DATE_FORMAT = "%Y%m%d"
+
+
+def partition_name(day: date) -> str:
+    """
+    Get name of the partition holding tokens expiring on a given day.
+
+    :param day: expiration day.
+    :return: partition table name.
+    """
+    return f"{PARTITION_PREFIX}{day.strftime(PARTITION_DATE_FORMAT)}"
+
+
+class RefreshTokenDAO:
+    """Class for accessing refresh_token table and its partitions."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create_token(
+        self,
+        token_hash: bytes,
+        user_id: int,
+        expires_at: datetime,
+    ) -> None:
+        """
+        Store a new refresh token.
+
+        :param token_hash: digest of the token.
+        :param user_id: owner of the token.
+        :param expires_at: expiration time of the token.
+        """
+        self.session.add(
+            RefreshTokenModel(
+                token_hash=token_hash,
+                user_id=user_id,
+                expires_at=expires_at,
+            ),
+        )
+
+    async def get_token(self, token_hash: bytes) -> Optional[RefreshTokenModel]:
+        """
+        Get not expired token by its digest.
+
+        :param token_hash: digest of the token.
+        :return: token or None if it doesn't exist or expired.
+        """
+        query = select(RefreshTokenModel).where(
+            RefreshTokenModel.token_hash == token_hash,
+            RefreshTokenModel.expires_at > datetime.now().astimezone(),
+        )
+        raw_token = await self.session.execute(query)
+        return raw_token.scalars().first()
+
+    async def is_revoked(self, token_hash: bytes) -> bool:
+        """
+        Check whether token was revoked.
+
+        :param token_hash: digest of the token.
+        :return: True if the token is revoked.
+        """
+        query = select(RefreshTokenModel.token_hash).where(
+            RefreshTokenModel.token_hash == token_hash,
+            RefreshTokenModel.revoked_at.is_not(None),
+        )
+        raw_token = await self.session.execute(query)
+        return raw_token.first() is not None
+
+    async def revoke_token(self, token_hash: bytes) -> None:
+        """
+        Mark token as revoked.
+
+        :param token_hash: digest of the token.
+        """
+        await self.session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.token_hash == token_hash,
+                RefreshTokenModel.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now().astimezone()),
+        )
+
+    async def get_revoked_hashes(self) -> List[bytes]:
+        """
+        Get digests of all revoked tokens which are not expired yet.
+
+        :return: list of token digests.
+        """
+        query = select(RefreshTokenModel.token_hash).where(
+            RefreshTokenModel.revoked_at.is_not(None),
+            RefreshTokenModel.expires_at > datetime.now().astimezone(),
+        )
+        raw_hashes = await self.session.execute(query)
+        return list(raw_hashes.scalars().fetchall())
+
+    async def lock_partitions(self) -> None:
+        """
+        Take transaction-level lock for partition maintenance.
+
+        Keeps workers from creating or dropping the same partition at once.
+        """
+        await self.session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:table_name))"),
+            {"table_name": RefreshTokenModel.__tablename__},
+        )
+
+    async def try_lock_partitions_session(self) -> bool:
+        """
+        Try to take session-level lock for partition maintenance.
+
+        Same lock as :meth:`lock_partitions`, for autocommit sessions.
+        It must be released with :meth:`unlock_partitions_session`.
+
+        :return: True if the lock is taken.
+        """
+        return await self.session.scalar(
+            text("SELECT pg_try_advisory_lock(hashtext(:table_name))"),
+            {"table_name": RefreshTokenModel.__tablename__},
+        )
+
+    async def unlock_partitions_session(self) -> None:
+        """Release lock taken by :meth:`try_lock_partitions_session`."""
+        await self.session.execute(
+            text("SELECT pg_advisory_unlock(hashtext(:table_name))"),
+            {"table_name": RefreshTokenModel.__tablename__},
+        )
+
+    async def set_lock_timeout(self, timeout_ms: int, local: bool = True) -> None:
+        """
+        Limit time statements wait for table locks.
+
+        :param timeout_ms: timeout in milliseconds, 0 disables it.
+        :param local: set it for the current transaction only,
+            otherwise for the whole database session.
+        """
+        await self.session.execute(
+            text("SELECT set_config('lock_timeout', :timeout, :local)"),
+            {"timeout": f"{timeout_ms}ms", "local": local},
+        )
+
+    async def reset_lock_timeout(self) -> None:
+        """Restore default lock timeout of the database session."""
+        await self.session.execute(text("RESET lock_timeout"))
+
+    async def get_partition_days(self) -> List[date]:
+        """
+        Get days covered by existing partitions.
+
+        Partitions detached by an interrupted drop are included too.
+
+        :return: sorted list of days.
+        """
+        raw_names = await self.session.execute(
+            text(
+                "SELECT relname FROM pg_class "
+                "WHERE relkind = 'r' AND starts_with(relname, :prefix) "
+                "AND pg_table_is_visible(oid)",
+            ),
+            {"prefix": PARTITION_PREFIX},
+        )
+        days = []
+        for name in raw_names.scalars():
+            if not name.startswith(PARTITION_PREFIX):
+                continue
+            suffix = name[len(PARTITION_PREFIX) :]
+            days.append(datetime.strptime(suffix, PARTITION_DATE_FORMAT).date())
+        return sorted(days)
+
+    async def create_partition(self, day: date) -> None:
+        """
+        Create partition for tokens expiring on a given day.
+
+        Partition bounds are UTC midnights.
+
+        :param day: expiration day.
+        """
+        await self.session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(day)} "
+                f"PARTITION OF {RefreshTokenModel.__tablename__} "
+                f"FOR VALUES FROM ('{day.isoformat()} 00:00+00') "
+                f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00+00')",
+            ),
+        )
+
+    async def detach_partition(self, day: date) -> None:
+        """
+        Detach partition without blocking access to the parent table.
+
+        ``DETACH PARTITION CONCURRENTLY`` can't run in a transaction,
+        so the session must be in autocommit mode. A detach interrupted
+        earlier is finalized instead.
+
+        :param day: expiration day of the partition.
+        """
+        detach_pending = await self.session.scalar(
+            text(
+                "SELECT inhdetachpending FROM pg_inherits "
+                "WHERE inhrelid = to_regclass(:partition)",
+            ),
+            {"partition": partition_name(day)},
+        )
+        if detach_pending is None:
+            return
+        mode = "FINALIZE" if detach_pending else "CONCURRENTLY"
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {RefreshTokenModel.__tablename__} "
+                f"DETACH PARTITION {partition_name(day)} {mode}",
+            ),
+        )
+
+    async def drop_partition(self, day: date) -> None:
+        """
+        Drop partition with all its tokens.
+
+        The partition should be detached first, otherwise dropping it
+        locks the parent table.
+
+        :param day: expiration day of the partition.
+        """
+        await self.session.execute(
+            text(f"DROP TABLE IF EXISTS {partition_name(day)}"),
+        )
@@ -7,7 +7,7 @@ def load_all_models() -> None:
     package_dir = Path(__file__).resolve().parent
     modules = pkgutil.walk_packages(
         path=[str(package_dir)],
-        prefix="auth.db.models.",
+        prefix="simple_transactions.auth.db.models.",
     )
     for module in modules:
         __import__(module.name)
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from simple_transactions.auth.db.base import Base
+
+
+class RefreshTokenModel(Base):
+    """
+    Issued refresh token.
+
+    Only the SHA-256 digest of the token is stored. The table is
+    partitioned by day of ``expires_at``, so expired sessions are removed
+    by dropping whole partitions instead of deleting rows.
+    """
+
+    __tablename__ = "refresh_token"
+    __table_args__ = {"postgresql_partition_by": "RANGE (expires_at)"}
+
+    token_hash: Mapped[bytes] = mapped_column(sa.LargeBinary(32), primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        primary_key=True,
+    )
+    user_id: Mapped[int] = mapped_column(sa.BigInteger, index=True)
+    issued_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+    )
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(
+        sa.DateTime(timezone=True),
+    )
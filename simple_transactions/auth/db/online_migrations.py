@@ -0,0 +1,326 @@
+"""
+Helpers for lock-safe migrations of large tables.
+
+These functions are meant to be called from ``upgrade``/``downgrade``
+of revisions in ``migration/versions``. They also work in offline
+(``--sql``) mode, which is used by the ``migration_dry_run`` lock report.
+"""
+
+import re
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from alembic import op
+from loguru import logger
+from sqlalchemy import TextClause, text
+from sqlalchemy.exc import OperationalError
+
+from simple_transactions.auth.settings import settings
+
+# SQLSTATE of "lock_not_available", raised when lock_timeout expires.
+LOCK_NOT_AVAILABLE = "55P03"
+
+Lock = Tuple[str, str]
+ResultType = TypeVar("ResultType")
+
+_NAME = r'"?([\w.]+)"?'
+_FLAGS = re.IGNORECASE | re.DOTALL
+
+# First matching rule gives the lock taken on the matched relation.
+# See "Table-Level Lock Modes" in the postgres documentation.
+LOCK_RULES: List[Tuple["re.Pattern[str]", str]] = [
+    (
+        re.compile(rf"^CREATE (?:UNIQUE )?INDEX CONCURRENTLY .*? ON {_NAME}", _FLAGS),
+        "SHARE UPDATE EXCLUSIVE",
+    ),
+    (re.compile(rf"^CREATE (?:UNIQUE )?INDEX .*? ON {_NAME}", _FLAGS), "SHARE"),
+    (
+        re.compile(rf"^DROP INDEX CONCURRENTLY (?:IF EXISTS )?{_NAME}", _FLAGS),
+        "SHARE UPDATE EXCLUSIVE",
+    ),
+    (re.compile(rf"^DROP INDEX (?:IF EXISTS )?{_NAME}", _FLAGS), "ACCESS EXCLUSIVE"),
+    (
+        re.compile(rf"^ALTER TABLE (?:ONLY )?{_NAME} VALIDATE CONSTRAINT", _FLAGS),
+        "SHARE UPDATE EXCLUSIVE",
+    ),
+    (
+        re.compile(
+            rf"^ALTER TABLE (?:ONLY )?{_NAME} ADD CONSTRAINT \S+ FOREIGN KEY",
+            _FLAGS,
+        ),
+        "SHARE ROW EXCLUSIVE",
+    ),
+    (re.compile(rf"^ALTER TABLE (?:ONLY )?{_NAME}", _FLAGS), "ACCESS EXCLUSIVE"),
+    (
+        re.compile(rf"^CREATE TABLE (?:IF NOT EXISTS )?{_NAME}", _FLAGS),
+        "ACCESS EXCLUSIVE",
+    ),
+    (re.compile(rf"^DROP TABLE (?:IF EXISTS )?{_NAME}", _FLAGS), "ACCESS EXCLUSIVE"),
+    (re.compile(rf"^TRUNCATE (?:TABLE )?{_NAME}", _FLAGS), "ACCESS EXCLUSIVE"),
+    (
+        re.compile(rf"^(?:UPDATE|DELETE FROM|INSERT INTO) {_NAME}", _FLAGS),
+        "ROW EXCLUSIVE",
+    ),
+]
+# Locks taken on other relations mentioned in a statement.
+REFERENCE_RULES: List[Tuple["re.Pattern[str]", str]] = [
+    (re.compile(rf"REFERENCES {_NAME}", _FLAGS), "SHARE ROW EXCLUSIVE"),
+    (re.compile(rf"PARTITION OF {_NAME}", _FLAGS), "ACCESS EXCLUSIVE"),
+]
+_REVISION_COMMENT = re.compile(r"^-- Running (.+)$")
+
+
+@contextmanager
+def _concurrent_block() -> Iterator[None]:
+    # Concurrent index builds wait for every older transaction, and the
+    # wait is cut by lock_timeout too, leaving an invalid index behind.
+    # They don't block writes, so they may wait as long as needed.
+    with op.get_context().autocommit_block():
+        op.execute("SET lock_timeout = 0")
+        try:
+            yield
+        finally:
+            op.execute("RESET lock_timeout")
+
+
+def _index_is_valid(index_name: str) -> Optional[bool]:
+    return op.get_bind().scalar(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": index_name},
+    )
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[Union[str, TextClause]],
+    **kwargs: object,
+) -> None:
+    """
+    Create index without blocking writes to the table.
+
+    ``CREATE INDEX CONCURRENTLY`` can't run inside a transaction,
+    so it is executed in an autocommit block without ``lock_timeout``.
+    An invalid index left by an interrupted build is dropped first.
+
+    :param index_name: name of the index.
+    :param table_name: name of the indexed table.
+    :param columns: indexed columns or ``text`` expressions.
+    :param kwargs: extra arguments for ``op.create_index``.
+    """
+    with _concurrent_block():
+        if not op.get_context().as_sql:
+            index_is_valid = _index_is_valid(index_name)
+            if index_is_valid:
+                logger.info(f"Index {index_name} already exists.")
+                return
+            if index_is_valid is not None:
+                logger.warning(f"Dropping invalid index {index_name}.")
+                op.drop_index(
+                    index_name,
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                )
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            postgresql_concurrently=True,
+            **kwargs,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """
+    Drop index without blocking access to the table.
+
+    :param index_name: name of the index.
+    :param table_name: name of the indexed table.
+    """
+    with _concurrent_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def _retry_on_lock_timeout(
+    operation: Callable[[], ResultType],
+    attempts: Optional[int],
+    backoff: Optional[float],
+) -> ResultType:
+    attempts = attempts or settings.migration_lock_retries
+    backoff = settings.migration_lock_retry_backoff if backoff is None else backoff
+    for attempt in range(1, attempts):
+        try:
+            return operation()
+        except OperationalError as exc:
+            if getattr(exc.orig, "pgcode", None) != LOCK_NOT_AVAILABLE:
+                raise
+            logger.warning(
+                f"Lock timeout on attempt {attempt}/{attempts}, "
+                f"retrying in {backoff * attempt} seconds.",
+            )
+            time.sleep(backoff * attempt)
+    return operation()
+
+
+def with_lock_retries(
+    operation: Callable[[], None],
+    attempts: Optional[int] = None,
+    backoff: Optional[float] = None,
+) -> None:
+    """
+    Run operation in a savepoint, retrying when it can't get a lock.
+
+    Together with ``lock_timeout`` this keeps a DDL statement from
+    queueing behind long transactions and stalling all traffic
+    which queues behind it.
+
+    :param operation: function running migration statements.
+    :param attempts: number of attempts, defaults to settings.
+    :param backoff: base pause in seconds, grows linearly with attempts.
+    """
+    if op.get_context().as_sql:
+        operation()
+        return
+
+    def run_in_savepoint() -> None:
+        with op.get_bind().begin_nested():
+            operation()
+
+    _retry_on_lock_timeout(run_in_savepoint, attempts, backoff)
+
+
+def backfill_in_batches(
+    table_name: str,
+    set_clause: str,
+    key_column: str = "id",
+    where: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    pause: Optional[float] = None,
+) -> None:
+    """
+    Update table in key ranges, committing every batch.
+
+    Each batch is a separate transaction, so row locks are held
+    only for one batch and replicas keep up. A batch which hits
+    ``lock_timeout`` is retried like in :func:`with_lock_retries`.
+    ``key_column`` must be an integer column.
+
+    :param table_name: table to update.
+    :param set_clause: SQL after ``SET``, e.g. ``"status = 'new'"``.
+    :param key_column: integer column used to split batches.
+    :param where: extra SQL condition for updated rows.
+    :param batch_size: size of key range per batch, defaults to settings.
+    :param pause: seconds to sleep between batches, defaults to settings.
+    """
+    batch_size = batch_size or settings.migration_backfill_batch_size
+    pause = settings.migration_backfill_pause if pause is None else pause
+    condition = f" AND ({where})" if where else ""
+    update_sql = (
+        f"UPDATE {table_name} SET {set_clause} "
+        f"WHERE {key_column} >= :start AND {key_column} < :end{condition}"
+    )
+
+    if op.get_context().as_sql:
+        # Offline SQL can't know key bounds, render one statement for all rows.
+        where_sql = f" WHERE {where}" if where else ""
+        op.execute(f"UPDATE {table_name} SET {set_clause}{where_sql}")
+        return
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        bounds = bind.execute(
+            text(f"SELECT min({key_column}), max({key_column}) FROM {table_name}"),
+        ).one()
+        if bounds[0] is None:
+            return
+        first_key, last_key = bounds
+        total_batches = (last_key - first_key) // batch_size + 1
+
+        updated_rows = 0
+        for batch in range(total_batches):
+            start = first_key + batch * batch_size
+            result = _retry_on_lock_timeout(
+                partial(
+                    bind.execute,
+                    text(update_sql),
+                    {"start": start, "end": start + batch_size},
+                ),
+                attempts=None,
+                backoff=None,
+            )
+            updated_rows += result.rowcount
+            logger.info(
+                f"Backfill of {table_name}: batch {batch + 1}/{total_batches}, "
+                f"{updated_rows} rows updated.",
+            )
+            if pause:
+                time.sleep(pause)
+
+
+def statement_locks(statement: str) -> List[Lock]:
+    """
+    Get table-level locks a statement takes.
+
+    :param statement: SQL statement.
+    :return: list of (relation, lock mode) pairs.
+    """
+    statement = statement.strip()
+    locks = []
+    for pattern, mode in LOCK_RULES:
+        match = pattern.match(statement)
+        if match:
+            locks.append((match.group(1), mode))
+            break
+    for pattern, mode in REFERENCE_RULES:
+        locks.extend((name, mode) for name in pattern.findall(statement))
+    return locks
+
+
+def report_locks(
+    sql: str,
+    version_table: str = "alembic_version",
+) -> Dict[str, List[Lock]]:
+    """
+    Get locks taken by every migration from offline migration SQL.
+
+    :param sql: output of migrations run in offline (``--sql``) mode.
+    :param version_table: table of alembic versions, excluded from report.
+    :return: locks by migration step, in order of migrations.
+    """
+    report: Dict[str, List[Lock]] = {}
+    step = "before migrations"
+    statement_lines: List[str] = []
+    for line in sql.splitlines():
+        revision_comment = _REVISION_COMMENT.match(line)
+        if revision_comment:
+            step = revision_comment.group(1)
+            continue
+        if not line.strip() or line.startswith("--"):
+            continue
+        statement_lines.append(line)
+        if not line.rstrip().endswith(";"):
+            continue
+        statement = "\n".join(statement_lines)
+        statement_lines = []
+        step_locks = report.setdefault(step, [])
+        for lock in statement_locks(statement):
+            if lock[0] != version_table and lock not in step_locks:
+                step_locks.append(lock)
+    return {step: locks for step, locks in report.items() if locks}
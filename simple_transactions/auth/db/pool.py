@@ -0,0 +1,39 @@
+import time
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class ExponentialAverage:
+    """Exponentially weighted moving average of samples."""
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        self.alpha = alpha
+        self.value = 0.0
+
+    def update(self, sample: float) -> None:
+        """
+        Add a new sample.
+
+        :param sample: observed value.
+        """
+        self.value += self.alpha * (sample - self.value)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool which tracks how long checkouts wait for a connection.
+
+    The average wait is available as ``pool.wait_time.value`` in seconds.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_time = ExponentialAverage()
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_time.update(time.perf_counter() - started)
@@ -0,0 +1,48 @@
+"""refresh_token
+
+Revision ID: 8f4d2a6c1e97
+Revises: 2dca3d1fd7a6
+Create Date: 2026-10-19 11:40:52.104377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8f4d2a6c1e97"
+down_revision: Union[str, None] = "2dca3d1fd7a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_token",
+        sa.Column("token_hash", sa.LargeBinary(length=32), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "issued_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("token_hash", "expires_at"),
+        postgresql_partition_by="RANGE (expires_at)",
+    )
+    op.create_index(
+        op.f("ix_refresh_token_user_id"),
+        "refresh_token",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_refresh_token_user_id"), table_name="refresh_token")
+    op.drop_table("refresh_token")
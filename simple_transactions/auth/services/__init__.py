@@ -0,0 +1 @@
+"""Services for simple_transactions auth."""
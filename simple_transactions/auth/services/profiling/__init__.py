@@ -0,0 +1,9 @@
+"""Request profiling and slow query capture."""
+
+from simple_transactions.auth.services.profiling.store import (
+    ProfileStore,
+    RequestProfile,
+    current_profile,
+)
+
+__all__ = ["ProfileStore", "RequestProfile", "current_profile"]
@@ -0,0 +1,108 @@
+import asyncio
+import time
+from typing import Any, Set
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from simple_transactions.auth.services.profiling.store import (
+    ProfileStore,
+    QueryTiming,
+    SlowQuery,
+    current_profile,
+)
+
+# Execution option marking statements which must not be profiled.
+SKIP_PROFILING = "skip_profiling"
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+MAX_PENDING_EXPLAINS = 4
+
+_explain_tasks: Set["asyncio.Task[None]"] = set()
+
+
+async def _explain(engine: AsyncEngine, slow_query: SlowQuery, parameters: Any) -> None:
+    try:
+        async with engine.connect() as connection:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN {slow_query.statement}",
+                parameters,
+                execution_options={SKIP_PROFILING: True},
+            )
+            slow_query.plan = [row[0] for row in result]
+    except Exception as exc:
+        logger.warning(f"Failed to explain slow query: {exc}")
+
+
+def _schedule_explain(
+    engine: AsyncEngine,
+    slow_query: SlowQuery,
+    parameters: Any,
+) -> None:
+    if len(_explain_tasks) >= MAX_PENDING_EXPLAINS:
+        return
+    if not slow_query.statement.lstrip().upper().startswith(EXPLAINABLE):
+        return
+    task = asyncio.get_running_loop().create_task(
+        _explain(engine, slow_query, parameters),
+    )
+    _explain_tasks.add(task)
+    task.add_done_callback(_explain_tasks.discard)
+
+
+def attach_query_listeners(
+    engine: AsyncEngine,
+    store: ProfileStore,
+    slow_query_threshold: float,
+) -> None:
+    """
+    Time every statement executed by the engine.
+
+    Statements are added to the profile of the current request
+    if it is sampled. Statements slower than the threshold are saved
+    to the store and explained on a separate connection in background.
+
+    :param engine: application engine.
+    :param store: store for slow queries.
+    :param slow_query_threshold: slow query threshold in seconds.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        duration = time.perf_counter() - conn.info["query_started_at"].pop()
+        if context.execution_options.get(SKIP_PROFILING):
+            return
+
+        profile = current_profile.get()
+        if profile is not None:
+            profile.queries.append(QueryTiming(statement, duration))
+
+        if duration >= slow_query_threshold:
+            slow_query = SlowQuery(statement, duration)
+            store.add_slow_query(slow_query)
+            if not executemany:
+                _schedule_explain(engine, slow_query, parameters)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(exception_context: Any) -> None:
+        started_at = exception_context.connection.info.get("query_started_at")
+        if started_at:
+            started_at.pop()
@@ -0,0 +1,118 @@
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class QueryTiming:
+    """SQL statement executed during a profiled request."""
+
+    statement: str
+    duration: float
+
+
+@dataclass
+class RequestProfile:
+    """Timings collected for one sampled request."""
+
+    method: str
+    route: str
+    started_at: datetime = field(default_factory=_now)
+    duration: float = 0.0
+    loop_lag: float = 0.0
+    queries: List[QueryTiming] = field(default_factory=list)
+
+
+@dataclass
+class SlowQuery:
+    """Statement which took longer than the slow query threshold."""
+
+    statement: str
+    duration: float
+    captured_at: datetime = field(default_factory=_now)
+    plan: Optional[List[str]] = None
+
+
+@dataclass
+class RouteStats:
+    """Wall time of sampled requests to one route."""
+
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+class ProfileStore:
+    """Bounded history of request profiles and slow queries."""
+
+    def __init__(self, history_size: int) -> None:
+        self.profiles: Deque[RequestProfile] = deque(maxlen=history_size)
+        self.slow_queries: Deque[SlowQuery] = deque(maxlen=history_size)
+        self.routes: Dict[str, RouteStats] = {}
+        self.loop_lag = 0.0
+        self.max_loop_lag = 0.0
+
+    def add_profile(self, profile: RequestProfile) -> None:
+        """
+        Save profile of a finished request.
+
+        :param profile: request profile.
+        """
+        self.profiles.append(profile)
+        stats = self.routes.setdefault(
+            f"{profile.method} {profile.route}",
+            RouteStats(),
+        )
+        stats.count += 1
+        stats.total_time += profile.duration
+        stats.max_time = max(stats.max_time, profile.duration)
+
+    def add_slow_query(self, slow_query: SlowQuery) -> None:
+        """
+        Save slow query.
+
+        :param slow_query: captured query.
+        """
+        self.slow_queries.append(slow_query)
+
+    def record_loop_lag(self, lag: float) -> None:
+        """
+        Save event loop lag measurement.
+
+        :param lag: seconds the loop was late to wake up a sleeping task.
+        """
+        self.loop_lag = lag
+        self.max_loop_lag = max(self.max_loop_lag, lag)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get JSON-serializable report.
+
+        :return: report with routes, profiles and slow queries.
+        """
+        return {
+            "loop_lag": self.loop_lag,
+            "max_loop_lag": self.max_loop_lag,
+            "routes": {
+                route: {
+                    **asdict(stats),
+                    "avg_time": stats.total_time / stats.count,
+                }
+                for route, stats in self.routes.items()
+            },
+            "profiles": [asdict(profile) for profile in self.profiles],
+            "slow_queries": [asdict(query) for query in self.slow_queries],
+        }
+
+
+# Profile of the request handled in the current task, None if not sampled.
+current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "current_profile",
+    default=None,
+)
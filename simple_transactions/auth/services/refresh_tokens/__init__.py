@@ -0,0 +1,9 @@
+"""Refresh token storage and revocation."""
+
+from simple_transactions.auth.services.refresh_tokens.bloom import BloomFilter
+from simple_transactions.auth.services.refresh_tokens.hashing import hash_token
+from simple_transactions.auth.services.refresh_tokens.revocation import (
+    RevocationCache,
+)
+
+__all__ = ["BloomFilter", "RevocationCache", "hash_token"]
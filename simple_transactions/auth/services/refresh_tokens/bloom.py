@@ -0,0 +1,72 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Bloom filter over byte strings.
+
+    Positions are derived from a single blake2b digest
+    with double hashing, so adding or checking an item
+    costs one hash call regardless of the number of hash functions.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[bytes],
+        capacity: int,
+        error_rate: float,
+    ) -> "BloomFilter":
+        """
+        Build filter containing given items.
+
+        :param items: items to add.
+        :param capacity: expected number of items.
+        :param error_rate: target false positive rate at full capacity.
+        :return: new filter.
+        """
+        bloom_filter = cls(capacity, error_rate)
+        for item in items:
+            bloom_filter.add(item)
+        return bloom_filter
+
+    def _positions(self, item: bytes) -> Iterable[int]:
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return (
+            (first + index * second) % self.size for index in range(self.hash_count)
+        )
+
+    def add(self, item: bytes) -> None:
+        """
+        Add item to the filter.
+
+        :param item: item to add.
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    @property
+    def fill_ratio(self) -> float:
+        """Fraction of bits that are set."""
+        return int.from_bytes(self._bits, "little").bit_count() / self.size
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """False positive rate expected from the current fill ratio."""
+        return self.fill_ratio**self.hash_count
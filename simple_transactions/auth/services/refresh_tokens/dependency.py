@@ -0,0 +1,15 @@
+from starlette.requests import Request
+
+from simple_transactions.auth.services.refresh_tokens.revocation import (
+    RevocationCache,
+)
+
+
+def get_revocation_cache(request: Request) -> RevocationCache:
+    """
+    Get revocation cache of the current worker.
+
+    :param request: current request.
+    :return: revocation cache.
+    """
+    return request.app.state.revocation_cache
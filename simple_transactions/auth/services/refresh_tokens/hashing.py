@@ -0,0 +1,11 @@
+import hashlib
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Get digest under which a refresh token is stored.
+
+    :param token: raw token issued to the client.
+    :return: 32 bytes of SHA-256 digest.
+    """
+    return hashlib.sha256(token.encode()).digest()
@@ -0,0 +1,195 @@
+import asyncio
+import contextlib
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from typing import Awaitable, Callable, List, TypeVar
+
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from simple_transactions.auth.db.dao.refresh_token_dao import RefreshTokenDAO
+from simple_transactions.auth.services.refresh_tokens.revocation import (
+    RevocationCache,
+)
+from simple_transactions.auth.settings import settings
+
+# SQLSTATE of "lock_not_available", raised when lock_timeout expires.
+LOCK_NOT_AVAILABLE = "55P03"
+
+ResultType = TypeVar("ResultType")
+
+
+async def _retry_on_lock_timeout(
+    operation: Callable[[], Awaitable[ResultType]],
+) -> ResultType:
+    attempts = settings.refresh_token_partition_lock_retries
+    backoff = settings.refresh_token_partition_lock_retry_backoff
+    for attempt in range(1, attempts):
+        try:
+            return await operation()
+        except DBAPIError as exc:
+            if getattr(exc.orig, "pgcode", None) != LOCK_NOT_AVAILABLE:
+                raise
+            logger.warning(
+                f"Lock timeout in partition maintenance on attempt "
+                f"{attempt}/{attempts}, retrying in {backoff * attempt} seconds.",
+            )
+            await asyncio.sleep(backoff * attempt)
+    return await operation()
+
+
+async def create_partitions(
+    session_factory: async_sessionmaker[AsyncSession],
+    today: date,
+) -> List[date]:
+    """
+    Create partitions for every day a newly issued token may expire on.
+
+    Creating a partition locks the parent table, so the wait for
+    the lock is limited and the caller retries on its expiry.
+
+    :param session_factory: factory for database sessions.
+    :param today: current UTC day.
+    :return: days of expired partitions.
+    """
+    async with session_factory() as session:
+        dao = RefreshTokenDAO(session)
+        await dao.lock_partitions()
+        await dao.set_lock_timeout(settings.refresh_token_partition_lock_timeout)
+        for offset in range(settings.refresh_token_ttl_days + 2):
+            await dao.create_partition(today + timedelta(days=offset))
+        expired_days = [day for day in await dao.get_partition_days() if day < today]
+        await session.commit()
+    return expired_days
+
+
+async def drop_partition(
+    session_factory: async_sessionmaker[AsyncSession],
+    day: date,
+) -> None:
+    """
+    Detach expired partition concurrently and drop it.
+
+    Detaching doesn't block reads and writes of the parent table,
+    and the detached table is dropped without locking the parent.
+
+    :param session_factory: factory for database sessions.
+    :param day: expiration day of the partition.
+    """
+    async with session_factory() as session:
+        await session.connection(
+            execution_options={"isolation_level": "AUTOCOMMIT"},
+        )
+        dao = RefreshTokenDAO(session)
+        if not await dao.try_lock_partitions_session():
+            return
+        try:
+            await dao.set_lock_timeout(
+                settings.refresh_token_partition_lock_timeout,
+                local=False,
+            )
+            await dao.detach_partition(day)
+            await dao.drop_partition(day)
+        finally:
+            await dao.reset_lock_timeout()
+            await dao.unlock_partitions_session()
+    logger.info(f"Dropped expired refresh token partition for {day}.")
+
+
+async def maintain_partitions(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """
+    Create upcoming partitions and drop expired ones.
+
+    Partitions are created for every day a newly issued token
+    may expire on. A partition is dropped once its upper bound
+    is in the past, i.e. when every token in it has expired.
+
+    :param session_factory: factory for database sessions.
+    """
+    today = datetime.now(timezone.utc).date()
+    expired_days = await _retry_on_lock_timeout(
+        partial(create_partitions, session_factory, today),
+    )
+    for day in expired_days:
+        await _retry_on_lock_timeout(partial(drop_partition, session_factory, day))
+
+
+async def refresh_revocation_cache(
+    cache: RevocationCache,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """
+    Rebuild revocation filter from the database.
+
+    :param cache: cache to rebuild.
+    :param session_factory: factory for database sessions.
+    """
+    cache.begin_rebuild()
+    async with session_factory() as session:
+        token_hashes = await RefreshTokenDAO(session).get_revoked_hashes()
+    cache.rebuild(token_hashes)
+
+
+async def _run_periodically(
+    interval: int,
+    name: str,
+    job: Callable[[], Awaitable[None]],
+) -> None:  # pragma: no cover
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except Exception:
+            logger.exception(f"Periodic {name} failed.")
+
+
+async def init_refresh_tokens(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Prepare partitions and revocation cache, start maintenance tasks.
+
+    :param app: current fastapi application.
+    """
+    session_factory = app.state.db_session_factory
+    await maintain_partitions(session_factory)
+
+    cache = RevocationCache(
+        capacity=settings.revocation_bloom_capacity,
+        error_rate=settings.revocation_bloom_error_rate,
+        session_factory=session_factory,
+    )
+    await refresh_revocation_cache(cache, session_factory)
+    app.state.revocation_cache = cache
+
+    app.state.refresh_token_tasks = [
+        asyncio.create_task(
+            _run_periodically(
+                settings.revocation_refresh_interval,
+                "revocation cache refresh",
+                lambda: refresh_revocation_cache(cache, session_factory),
+            ),
+        ),
+        asyncio.create_task(
+            _run_periodically(
+                settings.refresh_token_partition_interval,
+                "refresh token partition maintenance",
+                lambda: maintain_partitions(session_factory),
+            ),
+        ),
+    ]
+
+
+async def shutdown_refresh_tokens(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Stop maintenance tasks.
+
+    :param app: current fastapi application.
+    """
+    for task in app.state.refresh_token_tasks:
+        task.cancel()
+    for task in app.state.refresh_token_tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,139 @@
+from typing import Dict, Iterable, Optional, Set, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from simple_transactions.auth.db.dao.refresh_token_dao import RefreshTokenDAO
+from simple_transactions.auth.services.refresh_tokens.bloom import BloomFilter
+from simple_transactions.auth.services.single_flight import SingleFlight
+
+
+class RevocationCache:
+    """
+    In-process set of revoked refresh tokens.
+
+    The bloom filter answers "definitely not revoked" without touching
+    the database. Only positive answers are confirmed with a query,
+    and the share of positives not confirmed by the database is tracked
+    as the measured false positive rate.
+
+    Tokens revoked while the revoked set is read from the database
+    may be missing from the read, so they are kept aside and added
+    to the rebuilt filter.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.session_factory = session_factory
+        self._filter = BloomFilter(capacity, error_rate)
+        # Tokens added since the current rebuild started reading.
+        self._added_during_rebuild: Optional[Set[bytes]] = None
+        self.checks = 0
+        self.positives = 0
+        self.false_positives = 0
+        self._confirmations: SingleFlight[bool] = SingleFlight("token_revocation")
+
+    def begin_rebuild(self) -> None:
+        """Start keeping tokens added until :meth:`rebuild` is called."""
+        self._added_during_rebuild = set()
+
+    def rebuild(self, token_hashes: Iterable[bytes]) -> None:
+        """
+        Replace filter with one built from given revoked tokens.
+
+        Tokens added since :meth:`begin_rebuild` are kept in the new filter.
+
+        :param token_hashes: digests of all revoked tokens.
+        """
+        token_hashes = list(token_hashes)
+        if self._added_during_rebuild:
+            token_hashes.extend(self._added_during_rebuild)
+        self._added_during_rebuild = None
+        self._filter = BloomFilter.from_items(
+            token_hashes,
+            capacity=max(self.capacity, len(token_hashes) * 2),
+            error_rate=self.error_rate,
+        )
+
+    def add(self, token_hash: bytes) -> None:
+        """
+        Mark token as revoked in this worker.
+
+        :param token_hash: digest of the token.
+        """
+        self._filter.add(token_hash)
+        if self._added_during_rebuild is not None:
+            self._added_during_rebuild.add(token_hash)
+
+    def might_be_revoked(self, token_hash: bytes) -> bool:
+        """
+        Check token against the filter only.
+
+        :param token_hash: digest of the token.
+        :return: False if token is definitely not revoked.
+        """
+        self.checks += 1
+        if token_hash in self._filter:
+            self.positives += 1
+            return True
+        return False
+
+    async def is_revoked(self, token_hash: bytes) -> bool:
+        """
+        Check whether token is revoked.
+
+        Concurrent checks of the same token share one confirmation query.
+        It runs in its own session, so it doesn't depend on the session
+        of the request which started it.
+
+        :param token_hash: digest of the token.
+        :return: True if the token is revoked.
+        """
+        if not self.might_be_revoked(token_hash):
+            return False
+        revoked = await self._confirmations.do(
+            token_hash,
+            lambda: self._confirm(token_hash),
+        )
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    async def _confirm(self, token_hash: bytes) -> bool:
+        async with self.session_factory() as session:
+            return await RefreshTokenDAO(session).is_revoked(token_hash)
+
+    async def revoke(self, token_hash: bytes, dao: RefreshTokenDAO) -> None:
+        """
+        Revoke token in the database and in this worker.
+
+        :param token_hash: digest of the token.
+        :param dao: dao for refresh tokens.
+        """
+        await dao.revoke_token(token_hash)
+        self.add(token_hash)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get filter statistics.
+
+        :return: counters and false positive rates.
+        """
+        not_revoked = self.checks - (self.positives - self.false_positives)
+        return {
+            "checks": self.checks,
+            "positives": self.positives,
+            "false_positives": self.false_positives,
+            "measured_false_positive_rate": (
+                self.false_positives / not_revoked if not_revoked else 0.0
+            ),
+            "estimated_false_positive_rate": (
+                self._filter.estimated_false_positive_rate
+            ),
+            "fill_ratio": self._filter.fill_ratio,
+        }
@@ -1,6 +1,7 @@
 import enum
 from pathlib import Path
 from tempfile import gettempdir
+from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
@@ -19,6 +20,22 @@ class LogLevel(str, enum.Enum):
     FATAL = "FATAL"
 
 
+class LoopType(str, enum.Enum):
+    """Event loop implementations supported by uvicorn."""
+
+    AUTO = "auto"
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+class HttpType(str, enum.Enum):
+    """HTTP protocol implementations supported by uvicorn."""
+
+    AUTO = "auto"
+    H11 = "h11"
+    HTTPTOOLS = "httptools"
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -35,6 +52,15 @@ class Settings(BaseSettings):
     workers_count: int = 1
     # Enable uvicorn reloading
     reload: bool = False
+    # Event loop and HTTP parser, "auto" prefers uvloop and httptools if installed
+    loop: LoopType = LoopType.AUTO
+    http: HttpType = HttpType.AUTO
+    # Maximum number of pending connections
+    backlog: int = 2048
+    # Seconds to keep idle connections open
+    timeout_keep_alive: int = 5
+    # Maximum number of connections and tasks before responding with 503
+    limit_concurrency: Optional[int] = None
 
     # Current environment
     environment: str = "dev"
@@ -48,6 +74,54 @@ class Settings(BaseSettings):
     db_base: str = "simple_transactions"
     db_echo: bool = False
 
+    # Lifetime of refresh tokens, tokens are partitioned by expiration day
+    refresh_token_ttl_days: int = 30
+    # Interval in seconds between partition maintenance runs
+    refresh_token_partition_interval: int = 3600
+    # Partition maintenance: lock_timeout in milliseconds and retries on its expiry
+    refresh_token_partition_lock_timeout: int = 2000
+    refresh_token_partition_lock_retries: int = 5
+    refresh_token_partition_lock_retry_backoff: float = 1.0
+    # Interval in seconds between reloads of revoked tokens
+    revocation_refresh_interval: int = 30
+    # Sizing of the bloom filter with revoked tokens
+    revocation_bloom_capacity: int = 100_000
+    revocation_bloom_error_rate: float = 0.001
+
+    # Admission control: per route class limit of in-flight requests,
+    # adapted to keep average pool wait under admission_target_pool_wait
+    admission_initial_limit: int = 50
+    admission_min_limit: int = 4
+    admission_max_limit: int = 200
+    # Seconds a request may wait for a slot before it is shed with 503
+    admission_queue_timeout: float = 0.5
+    admission_retry_after: int = 1
+    admission_target_pool_wait: float = 0.05
+
+    # Token expected in the X-Admin-Token header by /admin endpoints.
+    # They expose SQL text of slow queries, so they are disabled if it is unset.
+    admin_token: Optional[str] = None
+
+    # Opt-in profiling of sampled requests and slow query capture
+    profiling_enabled: bool = False
+    # Profile every N-th request, 0 profiles only requests with the header
+    profiling_sample_rate: int = 0
+    profiling_header: str = "X-Profile"
+    # Number of kept profiles and slow queries
+    profiling_history_size: int = 100
+    # Queries slower than this many seconds are saved with their plan
+    slow_query_threshold: float = 0.5
+
+    # Migrations: lock_timeout in milliseconds and retries on its expiry
+    migration_lock_timeout: int = 5000
+    migration_lock_retries: int = 5
+    migration_lock_retry_backoff: float = 1.0
+    # Batched backfills: rows per batch and pause in seconds between batches
+    migration_backfill_batch_size: int = 10_000
+    migration_backfill_pause: float = 0.1
+    # Render pending migrations as SQL and report their locks without running them
+    migration_dry_run: bool = False
+
     # Location of alembic.ini
     alembic_ini: str = "alembic.ini"
     alembic_folder: str = "simple_transactions/auth/migration"
@@ -0,0 +1,35 @@
+from simple_transactions.auth.services.refresh_tokens.revocation import (
+    RevocationCache,
+)
+
+
+def make_cache() -> RevocationCache:
+    return RevocationCache(capacity=100, error_rate=0.001, session_factory=None)
+
+
+def test_rebuild_replaces_filter() -> None:
+    cache = make_cache()
+    cache.add(b"stale")
+
+    cache.begin_rebuild()
+    cache.rebuild([b"revoked"])
+
+    assert cache.might_be_revoked(b"revoked")
+    assert not cache.might_be_revoked(b"stale")
+
+
+def test_rebuild_keeps_tokens_revoked_during_read() -> None:
+    cache = make_cache()
+
+    cache.begin_rebuild()
+    # Revoked while the database is read, missing from the read.
+    cache.add(b"revoked during read")
+    cache.rebuild([b"revoked"])
+
+    assert cache.might_be_revoked(b"revoked")
+    assert cache.might_be_revoked(b"revoked during read")
+
+    cache.begin_rebuild()
+    cache.rebuild([])
+
+    assert not cache.might_be_revoked(b"revoked during read")
@@ -0,0 +1,27 @@
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from simple_transactions.auth.settings import settings
+
+
+def verify_admin_token(
+    x_admin_token: Optional[str] = Header(default=None),
+) -> None:
+    """
+    Allow access to admin endpoints only with the admin token.
+
+    Admin endpoints are hidden when no token is configured.
+
+    :param x_admin_token: token from the X-Admin-Token header.
+    :raises HTTPException: if admin endpoints are disabled
+        or the token doesn't match.
+    """
+    if settings.admin_token is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token,
+        settings.admin_token,
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
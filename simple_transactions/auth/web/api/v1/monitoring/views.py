@@ -1,4 +1,18 @@
-from fastapi import APIRouter
+from typing import Any, Dict, Union
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from simple_transactions.auth.db.dependencies import get_db_session
+from simple_transactions.auth.services.profiling.dependency import (
+    get_profile_store,
+)
+from simple_transactions.auth.services.profiling.store import ProfileStore
+from simple_transactions.auth.services.single_flight import single_flight_stats
+from simple_transactions.auth.web.api.v1.monitoring.dependencies import (
+    verify_admin_token,
+)
 
 router = APIRouter()
 
@@ -10,3 +24,48 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get("/health/db")
+async def db_health_check(
+    session: AsyncSession = Depends(get_db_session),
+) -> None:
+    """
+    Checks that the database is reachable.
+
+    It returns 200 if a query succeeds.
+
+    :param session: database session.
+    """
+    await session.execute(text("SELECT 1"))
+
+
+@router.get("/admin/profiling", dependencies=[Depends(verify_admin_token)])
+async def profiling_report(
+    store: ProfileStore = Depends(get_profile_store),
+) -> Dict[str, Any]:
+    """
+    Get profiles of sampled requests and captured slow queries.
+
+    Data is collected per worker, so every call shows
+    only requests handled by the worker which serves it.
+    The report contains SQL text of slow queries, so it requires
+    the admin token. It is async to be built on the event loop,
+    which is the only writer of the store.
+
+    :param store: profile store.
+    :return: profiling report.
+    """
+    return store.to_dict()
+
+
+@router.get("/admin/single-flight", dependencies=[Depends(verify_admin_token)])
+async def single_flight_report() -> Dict[str, Dict[str, Union[int, float]]]:
+    """
+    Get coalescing metrics of single-flight groups of this worker.
+
+    It is async to read metrics on the event loop, which updates them.
+
+    :return: metrics by group name.
+    """
+    return single_flight_stats()
@@ -1,3 +1,5 @@
+import asyncio
+import importlib.util
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -7,13 +9,22 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from alembic import command
 from alembic.config import Config
 
-from simple_transactions.auth.settings import settings
+from simple_transactions.auth.db.pool import TimedAsyncAdaptedQueuePool
+from simple_transactions.auth.settings import HttpType, LoopType, settings
 
 from sqlalchemy import create_engine, text
 
 from loguru import logger
 
 from simple_transactions.auth.log import configure_logging
+from simple_transactions.auth.services.profiling.lifespan import (
+    init_profiling,
+    shutdown_profiling,
+)
+from simple_transactions.auth.services.refresh_tokens.lifespan import (
+    init_refresh_tokens,
+    shutdown_refresh_tokens,
+)
 
 
 def _test_db_connection():
@@ -26,6 +37,29 @@ def _test_db_connection():
         engine.dispose()
 
 
+def _log_server_setup() -> None:
+    """
+    Log event loop and HTTP parser actually used by the server.
+
+    With "auto" settings uvicorn silently falls back
+    to asyncio and h11 when uvloop or httptools are not installed.
+    """
+    loop_type = type(asyncio.get_running_loop())
+    http_type = settings.http
+    if http_type == HttpType.AUTO:
+        http_available = importlib.util.find_spec("httptools") is not None
+        http_type = HttpType.HTTPTOOLS if http_available else HttpType.H11
+    logger.info(
+        f"Running on {loop_type.__module__}.{loop_type.__name__} loop "
+        f"with {http_type.value} HTTP parser.",
+    )
+    uvloop_used = loop_type.__module__.startswith("uvloop")
+    if settings.loop == LoopType.AUTO and not uvloop_used:
+        logger.warning("uvloop is not installed, using asyncio event loop.")
+    if settings.http == HttpType.AUTO and http_type == HttpType.H11:
+        logger.warning("httptools is not installed, using h11 HTTP parser.")
+
+
 def _setup_db(app: FastAPI) -> None:  # pragma: no cover
     """
     Creates connection to the database.
@@ -36,7 +70,11 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    engine = create_async_engine(
+        str(settings.db_url),
+        echo=settings.db_echo,
+        poolclass=TimedAsyncAdaptedQueuePool,
+    )
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
@@ -67,12 +105,17 @@ async def lifespan_setup(
     :return: function that actually performs actions.
     """
     configure_logging()
+    _log_server_setup()
     app.middleware_stack = None
     _setup_db(app)
+    init_profiling(app)
     _test_db_connection()
     _run_migrations()
+    await init_refresh_tokens(app)
 
     app.middleware_stack = app.build_middleware_stack()
 
     yield
+    await shutdown_refresh_tokens(app)
+    await shutdown_profiling(app)
     await app.state.db_engine.dispose()
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from simple_transactions.operation.db.dependencies import get_db_session
+from simple_transactions.operation.db.models.account import AccountModel
+
+
+class AccountDAO:
+    """Class for accessing account table."""
+
+    def __init__(self, session: AsyncSession = Depends(get_db_session)) -> None:
+        self.session = session
+
+    async def get_account(self, account_id: int) -> Optional[AccountModel]:
+        """
+        Get account by id.
+
+        :param account_id: id of the account.
+        :return: account or None if it doesn't exist.
+        """
+        return await self.session.get(AccountModel, account_id)
@@ -0,0 +1,23 @@
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from simple_transactions.operation.db.models.fx_rate import FxRateModel
+
+
+class FxRateDAO:
+    """Class for accessing fx_rate table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_all_rates(self) -> List[FxRateModel]:
+        """
+        Get all known exchange rates.
+
+        :return: list of rates.
+        """
+        raw_rates = await self.session.execute(select(FxRateModel))
+
+        return list(raw_rates.scalars().fetchall())
@@ -0,0 +1,90 @@
+from typing import Any, List, Sequence
+
+from sqlalchemy import Row, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class LedgerDAO:
+    """Class for reading aggregates of ledger_entry table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_last_entry_id(self) -> int:
+        """
+        Get id of the newest ledger entry.
+
+        :return: id of the entry, 0 if the ledger is empty.
+        """
+        last_id = await self.session.scalar(text("SELECT max(id) FROM ledger_entry"))
+        return last_id or 0
+
+    async def get_outgoing_buckets(
+        self,
+        account_ids: Sequence[int],
+        since: float,
+        bucket_seconds: float,
+        until_id: int,
+    ) -> List[Row[Any]]:
+        """
+        Count outgoing transfers of accounts in time buckets.
+
+        Outgoing transfers are entries with negative amount.
+
+        :param account_ids: ids of accounts.
+        :param since: unix timestamp of the oldest entry to count.
+        :param bucket_seconds: length of a bucket in seconds.
+        :param until_id: id of the newest entry to count.
+        :return: rows with account_id, epoch, transfers and amount.
+        """
+        raw_buckets = await self.session.execute(
+            text(
+                "SELECT account_id, "
+                "floor(extract(epoch FROM created_at) / :bucket_seconds)::bigint "
+                "AS epoch, "
+                "count(*) AS transfers, sum(-amount) AS amount "
+                "FROM ledger_entry "
+                "WHERE account_id = ANY(:account_ids) AND amount < 0 "
+                "AND created_at >= to_timestamp(:since) AND id <= :until_id "
+                "GROUP BY account_id, epoch",
+            ),
+            {
+                "account_ids": list(account_ids),
+                "since": since,
+                "bucket_seconds": bucket_seconds,
+                "until_id": until_id,
+            },
+        )
+        return list(raw_buckets.fetchall())
+
+    async def get_outgoing_transfers(
+        self,
+        account_ids: Sequence[int],
+        after_id: int,
+        until_id: int,
+    ) -> List[Row[Any]]:
+        """
+        Get outgoing transfers of accounts in a range of entry ids.
+
+        :param account_ids: ids of accounts.
+        :param after_id: id of the last already read entry.
+        :param until_id: id of the newest entry to read.
+        :return: rows with id, account_id, created_at as unix timestamp
+            and amount.
+        """
+        raw_transfers = await self.session.execute(
+            text(
+                "SELECT id, account_id, "
+                "extract(epoch FROM created_at) AS created_at, "
+                "-amount AS amount "
+                "FROM ledger_entry "
+                "WHERE id > :after_id AND id <= :until_id "
+                "AND account_id = ANY(:account_ids) AND amount < 0",
+            ),
+            {
+                "account_ids": list(account_ids),
+                "after_id": after_id,
+                "until_id": until_id,
+            },
+        )
+        return list(raw_transfers.fetchall())
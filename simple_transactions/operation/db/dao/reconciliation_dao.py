@@ -0,0 +1,127 @@
+from typing import Any, AsyncIterator, Dict, List
+
+from sqlalchemy import Row, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from simple_transactions.operation.db.models.account_reconciliation import (
+    AccountReconciliationModel,
+)
+
+# Stored balance of every account in a hash range with the sum
+# of its ledger entries after the last checkpoint. ``settled_*`` columns
+# cover only entries up to the new watermark. Accounts are found with
+# ``ix_account_id_hash`` and entries are summed per account with a range
+# scan of ``ix_ledger_entry_account_id_id``, so a shard never scans
+# the whole ledger.
+SHARD_QUERY = text(
+    "SELECT account.id AS account_id, account.balance, "
+    "coalesce(checkpoint.reconciled_balance, 0) AS reconciled_balance, "
+    "coalesce(entry.delta, 0) AS delta, "
+    "coalesce(entry.settled_delta, 0) AS settled_delta, "
+    "entry.settled_count "
+    "FROM account "
+    "LEFT JOIN account_reconciliation AS checkpoint "
+    "ON checkpoint.account_id = account.id AND NOT :full "
+    "CROSS JOIN LATERAL ("
+    "SELECT sum(amount) AS delta, "
+    "sum(amount) FILTER (WHERE id <= :watermark) AS settled_delta, "
+    "count(*) FILTER (WHERE id <= :watermark) AS settled_count "
+    "FROM ledger_entry "
+    "WHERE account_id = account.id "
+    "AND id > coalesce(checkpoint.watermark, 0)"
+    ") AS entry "
+    "WHERE hashint8(account.id) BETWEEN :low AND :high",
+)
+
+
+class ReconciliationDAO:
+    """Class for reading balances and saving reconciliation checkpoints."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def export_snapshot(self) -> str:
+        """
+        Export snapshot of the current transaction.
+
+        The session must be in a REPEATABLE READ transaction,
+        which has to stay open while the snapshot is used.
+
+        :return: snapshot id.
+        """
+        return await self.session.scalar(text("SELECT pg_export_snapshot()"))
+
+    async def use_snapshot(self, snapshot_id: str) -> None:
+        """
+        Make the current transaction see an exported snapshot.
+
+        Must be the first statement of a REPEATABLE READ transaction.
+
+        :param snapshot_id: id returned by :meth:`export_snapshot`.
+        """
+        await self.session.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'"))
+
+    async def get_settled_watermark(self, settle_seconds: int) -> int:
+        """
+        Get id of the newest ledger entry older than ``settle_seconds``.
+
+        Entries are created with ascending ids, but concurrent transactions
+        may commit out of order. Entries older than the settle interval
+        are assumed to be committed, so no entry with a lower id can
+        appear after the watermark is taken.
+
+        :param settle_seconds: age after which entries are settled.
+        :return: watermark, 0 if there are no settled entries.
+        """
+        watermark = await self.session.scalar(
+            text(
+                "SELECT id FROM ledger_entry "
+                "WHERE created_at < now() - make_interval(secs => :settle) "
+                "ORDER BY id DESC LIMIT 1",
+            ),
+            {"settle": settle_seconds},
+        )
+        return watermark or 0
+
+    async def stream_shard(
+        self,
+        low: int,
+        high: int,
+        watermark: int,
+        full: bool,
+        fetch_size: int,
+    ) -> AsyncIterator[Row[Any]]:
+        """
+        Stream balances of accounts in a hash range.
+
+        :param low: lowest ``hashint8`` of account id in the shard.
+        :param high: highest ``hashint8`` of account id in the shard.
+        :param watermark: id of the last settled ledger entry.
+        :param full: ignore checkpoints and sum the whole ledger.
+        :param fetch_size: number of rows fetched from the cursor at once.
+        :yield: rows of :data:`SHARD_QUERY`.
+        """
+        result = await self.session.stream(
+            SHARD_QUERY.execution_options(yield_per=fetch_size),
+            {"low": low, "high": high, "watermark": watermark, "full": full},
+        )
+        async for row in result:
+            yield row
+
+    async def save_checkpoints(self, checkpoints: List[Dict[str, Any]]) -> None:
+        """
+        Insert or update checkpoints of clean accounts.
+
+        :param checkpoints: dicts with account_id, reconciled_balance and watermark.
+        """
+        query = insert(AccountReconciliationModel)
+        query = query.on_conflict_do_update(
+            index_elements=[AccountReconciliationModel.account_id],
+            set_={
+                "reconciled_balance": query.excluded.reconciled_balance,
+                "watermark": query.excluded.watermark,
+                "reconciled_at": func.now(),
+            },
+        )
+        await self.session.execute(query, checkpoints)
@@ -0,0 +1,198 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import Depends
+from sqlalchemy import case, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from simple_transactions.operation.db.dependencies import get_db_session
+from simple_transactions.operation.db.models.statement_job import (
+    StatementChunkModel,
+    StatementJobModel,
+    StatementJobStatus,
+)
+
+UNFINISHED_STATUSES = (
+    StatementJobStatus.PENDING.value,
+    StatementJobStatus.RUNNING.value,
+)
+
+
+class StatementJobDAO:
+    """Class for accessing statement_job and statement_chunk tables."""
+
+    def __init__(self, session: AsyncSession = Depends(get_db_session)) -> None:
+        self.session = session
+
+    async def create_job(
+        self,
+        period_start: date,
+        period_end: date,
+    ) -> StatementJobModel:
+        """
+        Create pending statement job.
+
+        :param period_start: first day of the period.
+        :param period_end: day after the last day of the period.
+        :return: created job.
+        """
+        job = StatementJobModel(period_start=period_start, period_end=period_end)
+        self.session.add(job)
+        await self.session.flush()
+        await self.session.refresh(job)
+        return job
+
+    async def get_job(self, job_id: int) -> Optional[StatementJobModel]:
+        """
+        Get job by id.
+
+        :param job_id: id of the job.
+        :return: job or None if it doesn't exist.
+        """
+        return await self.session.get(StatementJobModel, job_id)
+
+    async def get_unfinished_job_ids(self) -> List[int]:
+        """
+        Get ids of jobs which are pending or were interrupted.
+
+        :return: list of job ids in order of creation.
+        """
+        raw_ids = await self.session.execute(
+            select(StatementJobModel.id)
+            .where(StatementJobModel.status.in_(UNFINISHED_STATUSES))
+            .order_by(StatementJobModel.id),
+        )
+        return list(raw_ids.scalars().fetchall())
+
+    async def plan_chunks(self, job: StatementJobModel, chunk_size: int) -> None:
+        """
+        Split accounts into chunks of ``chunk_size`` accounts.
+
+        :param job: job to plan.
+        :param chunk_size: number of accounts in a chunk.
+        """
+        raw_ranges = await self.session.execute(
+            text(
+                "SELECT min(id), max(id) FROM ("
+                "SELECT id, (row_number() OVER (ORDER BY id) - 1) / :size AS chunk "
+                "FROM account"
+                ") AS numbered GROUP BY chunk ORDER BY chunk",
+            ),
+            {"size": chunk_size},
+        )
+        chunks = [
+            StatementChunkModel(
+                job_id=job.id,
+                chunk_no=chunk_no,
+                first_account_id=first_account_id,
+                last_account_id=last_account_id,
+            )
+            for chunk_no, (first_account_id, last_account_id) in enumerate(raw_ranges)
+        ]
+        self.session.add_all(chunks)
+        job.total_chunks = len(chunks)
+
+    async def get_pending_chunks(self, job_id: int) -> List[StatementChunkModel]:
+        """
+        Get chunks of a job which are not done yet.
+
+        :param job_id: id of the job.
+        :return: list of chunks.
+        """
+        raw_chunks = await self.session.execute(
+            select(StatementChunkModel)
+            .where(
+                StatementChunkModel.job_id == job_id,
+                StatementChunkModel.status != StatementJobStatus.DONE.value,
+            )
+            .order_by(StatementChunkModel.chunk_no),
+        )
+        return list(raw_chunks.scalars().fetchall())
+
+    async def mark_chunk_done(
+        self,
+        job_id: int,
+        chunk_no: int,
+        file_path: str,
+        rows: int,
+    ) -> None:
+        """
+        Save chunk result and advance progress of its job.
+
+        :param job_id: id of the job.
+        :param chunk_no: number of the chunk.
+        :param file_path: path to the written statement file.
+        :param rows: number of written ledger entries.
+        """
+        await self.session.execute(
+            update(StatementChunkModel)
+            .where(
+                StatementChunkModel.job_id == job_id,
+                StatementChunkModel.chunk_no == chunk_no,
+            )
+            .values(
+                status=StatementJobStatus.DONE.value,
+                file_path=file_path,
+                rows=rows,
+            ),
+        )
+        await self.session.execute(
+            update(StatementJobModel)
+            .where(StatementJobModel.id == job_id)
+            .values(done_chunks=StatementJobModel.done_chunks + 1),
+        )
+
+    async def record_failure(
+        self,
+        job_id: int,
+        error: str,
+        max_attempts: int,
+    ) -> StatementJobStatus:
+        """
+        Count failed run of a job and save its error.
+
+        The job stays running to be resumed, and fails
+        once it has failed ``max_attempts`` times.
+
+        :param job_id: id of the job.
+        :param error: error message.
+        :param max_attempts: number of runs a job may fail.
+        :return: new status of the job.
+        """
+        failed_attempts = StatementJobModel.failed_attempts + 1
+        raw_status = await self.session.execute(
+            update(StatementJobModel)
+            .where(StatementJobModel.id == job_id)
+            .values(
+                failed_attempts=failed_attempts,
+                status=case(
+                    (
+                        failed_attempts >= max_attempts,
+                        StatementJobStatus.FAILED.value,
+                    ),
+                    else_=StatementJobStatus.RUNNING.value,
+                ),
+                error=error,
+            )
+            .returning(StatementJobModel.status),
+        )
+        return StatementJobStatus(raw_status.scalar_one())
+
+    async def set_status(
+        self,
+        job_id: int,
+        status: StatementJobStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Update job status.
+
+        :param job_id: id of the job.
+        :param status: new status.
+        :param error: error message for failed jobs.
+        """
+        await self.session.execute(
+            update(StatementJobModel)
+            .where(StatementJobModel.id == job_id)
+            .values(status=status.value, error=error),
+        )
@@ -0,0 +1,23 @@
+from datetime import datetime
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from simple_transactions.operation.db.base import Base
+
+
+class AccountModel(Base):
+    """Account with its stored balance."""
+
+    __tablename__ = "account"
+    __table_args__ = (sa.Index("ix_account_id_hash", sa.func.hashint8(sa.text("id"))),)
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    currency: Mapped[str] = mapped_column(sa.String(3))
+    balance: Mapped[Decimal] = mapped_column(sa.Numeric(20, 4), default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+    )
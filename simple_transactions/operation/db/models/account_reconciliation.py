@@ -0,0 +1,30 @@
+from datetime import datetime
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from simple_transactions.operation.db.base import Base
+
+
+class AccountReconciliationModel(Base):
+    """
+    Last clean reconciliation checkpoint of an account.
+
+    ``reconciled_balance`` is the sum of all ledger entries
+    of the account with id up to ``watermark``.
+    """
+
+    __tablename__ = "account_reconciliation"
+
+    account_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("account.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    reconciled_balance: Mapped[Decimal] = mapped_column(sa.Numeric(20, 4))
+    watermark: Mapped[int] = mapped_column(sa.BigInteger)
+    reconciled_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+    )
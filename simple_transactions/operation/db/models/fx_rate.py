@@ -0,0 +1,26 @@
+from datetime import datetime
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from simple_transactions.operation.db.base import Base
+
+
+class FxRateModel(Base):
+    """
+    Exchange rate between two currencies.
+
+    One unit of ``base_currency`` costs ``rate`` units of ``quote_currency``.
+    """
+
+    __tablename__ = "fx_rate"
+
+    base_currency: Mapped[str] = mapped_column(sa.String(3), primary_key=True)
+    quote_currency: Mapped[str] = mapped_column(sa.String(3), primary_key=True)
+    rate: Mapped[Decimal] = mapped_column(sa.Numeric(24, 12))
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+    )
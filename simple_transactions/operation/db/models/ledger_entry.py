@@ -0,0 +1,30 @@
+from datetime import datetime
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from simple_transactions.operation.db.base import Base
+
+
+class LedgerEntryModel(Base):
+    """
+    Posting to an account.
+
+    Entries are append-only. Balance of an account
+    is the sum of amounts of all its entries.
+    """
+
+    __tablename__ = "ledger_entry"
+    __table_args__ = (
+        sa.Index("ix_ledger_entry_account_id_id", "account_id", "id"),
+        sa.Index("ix_ledger_entry_account_id_created_at", "account_id", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    account_id: Mapped[int] = mapped_column(sa.ForeignKey("account.id"))
+    amount: Mapped[Decimal] = mapped_column(sa.Numeric(20, 4))
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+    )
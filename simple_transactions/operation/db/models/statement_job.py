@@ -0,0 +1,69 @@
+import enum
+from datetime import date, datetime
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from simple_transactions.operation.db.base import Base
+
+
+class StatementJobStatus(str, enum.Enum):
+    """Possible states of statement jobs and their chunks."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class StatementJobModel(Base):
+    """Job building statements of all accounts for a period."""
+
+    __tablename__ = "statement_job"
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    period_start: Mapped[date] = mapped_column(sa.Date)
+    period_end: Mapped[date] = mapped_column(sa.Date)
+    status: Mapped[str] = mapped_column(
+        sa.String(16),
+        default=StatementJobStatus.PENDING.value,
+        index=True,
+    )
+    total_chunks: Mapped[Optional[int]] = mapped_column(sa.Integer)
+    done_chunks: Mapped[int] = mapped_column(sa.Integer, default=0)
+    failed_attempts: Mapped[int] = mapped_column(
+        sa.Integer,
+        default=0,
+        server_default="0",
+    )
+    error: Mapped[Optional[str]] = mapped_column(sa.Text)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+    )
+
+
+class StatementChunkModel(Base):
+    """
+    Range of accounts processed as one unit of a statement job.
+
+    Finished chunks are checkpoints: a resumed job
+    skips every chunk which is already done.
+    """
+
+    __tablename__ = "statement_chunk"
+
+    job_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("statement_job.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    chunk_no: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    first_account_id: Mapped[int] = mapped_column(sa.BigInteger)
+    last_account_id: Mapped[int] = mapped_column(sa.BigInteger)
+    status: Mapped[str] = mapped_column(
+        sa.String(16),
+        default=StatementJobStatus.PENDING.value,
+    )
+    rows: Mapped[Optional[int]] = mapped_column(sa.BigInteger)
+    file_path: Mapped[Optional[str]] = mapped_column(sa.Text)
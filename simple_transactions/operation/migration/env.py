@@ -1,7 +1,12 @@
+import io
+
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
+from alembic.runtime.migration import MigrationContext
+from loguru import logger
 from simple_transactions.operation.db.models import load_all_models
+from simple_transactions.operation.db.online_migrations import report_locks
 from simple_transactions.operation.settings import settings
 
 config = context.config
@@ -29,13 +34,51 @@ def run_migrations_offline():
         context.run_migrations()
 
 
+def report_migration_locks(current_heads):
+    """
+    Log locks taken by pending migrations without running them.
+
+    Pending migrations are rendered as SQL like in offline mode,
+    so no DDL is executed and no lock is taken on the database.
+    """
+    output_buffer = io.StringIO()
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        as_sql=True,
+        starting_rev=current_heads[0] if current_heads else None,
+        output_buffer=output_buffer,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+    locks_by_step = report_locks(output_buffer.getvalue())
+    if not locks_by_step:
+        logger.info("Pending migrations take no table locks.")
+    for step, locks in locks_by_step.items():
+        for relation, mode in locks:
+            logger.info(f"Running {step} takes {mode} lock on {relation}.")
+
+
 def run_migrations_online():
     engine = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args={"options": f"-c lock_timeout={settings.migration_lock_timeout}"},
     )
     connection = engine.connect()
+
+    if settings.migration_dry_run:
+        try:
+            current_heads = MigrationContext.configure(connection).get_current_heads()
+        finally:
+            connection.close()
+        report_migration_locks(current_heads)
+        return
+
     context.configure(connection=connection, target_metadata=target_metadata)
 
     try:
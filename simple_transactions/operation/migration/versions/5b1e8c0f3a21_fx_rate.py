@@ -0,0 +1,39 @@
+"""fx_rate
+
+Revision ID: 5b1e8c0f3a21
+Revises: 2dca3d1fd7a6
+Create Date: 2026-10-19 10:02:11.518304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e8c0f3a21"
+down_revision: Union[str, None] = "2dca3d1fd7a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fx_rate",
+        sa.Column("base_currency", sa.String(length=3), nullable=False),
+        sa.Column("quote_currency", sa.String(length=3), nullable=False),
+        sa.Column("rate", sa.Numeric(precision=24, scale=12), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("base_currency", "quote_currency"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fx_rate")
@@ -0,0 +1,33 @@
+"""ledger_entry account_id created_at index
+
+Revision ID: a4d6c2e8f913
+Revises: e7b2f90a6c13
+Create Date: 2026-10-19 19:42:10.518302
+
+"""
+
+from typing import Sequence, Union
+
+from simple_transactions.operation.db.online_migrations import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d6c2e8f913"
+down_revision: Union[str, None] = "e7b2f90a6c13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_ledger_entry_account_id_created_at",
+        "ledger_entry",
+        ["account_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_ledger_entry_account_id_created_at", "ledger_entry")
@@ -0,0 +1,35 @@
+"""account id hash index
+
+Revision ID: b81f5e3d2c07
+Revises: a4d6c2e8f913
+Create Date: 2026-10-19 20:05:37.902416
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from simple_transactions.operation.db.online_migrations import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b81f5e3d2c07"
+down_revision: Union[str, None] = "a4d6c2e8f913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_account_id_hash",
+        "account",
+        [sa.text("hashint8(id)")],
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_account_id_hash", "account")
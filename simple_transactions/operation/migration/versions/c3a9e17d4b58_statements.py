@@ -0,0 +1,103 @@
+"""statements
+
+Revision ID: c3a9e17d4b58
+Revises: 5b1e8c0f3a21
+Create Date: 2026-10-19 15:21:37.840512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9e17d4b58"
+down_revision: Union[str, None] = "5b1e8c0f3a21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("balance", sa.Numeric(precision=20, scale=4), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "ledger_entry",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("account_id", sa.BigInteger(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=20, scale=4), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["account_id"], ["account.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_ledger_entry_account_id_id",
+        "ledger_entry",
+        ["account_id", "id"],
+        unique=False,
+    )
+    op.create_table(
+        "statement_job",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("period_end", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("total_chunks", sa.Integer(), nullable=True),
+        sa.Column("done_chunks", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_statement_job_status"),
+        "statement_job",
+        ["status"],
+        unique=False,
+    )
+    op.create_table(
+        "statement_chunk",
+        sa.Column("job_id", sa.BigInteger(), nullable=False),
+        sa.Column("chunk_no", sa.Integer(), nullable=False),
+        sa.Column("first_account_id", sa.BigInteger(), nullable=False),
+        sa.Column("last_account_id", sa.BigInteger(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("rows", sa.BigInteger(), nullable=True),
+        sa.Column("file_path", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["job_id"],
+            ["statement_job.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("job_id", "chunk_no"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("statement_chunk")
+    op.drop_index(op.f("ix_statement_job_status"), table_name="statement_job")
+    op.drop_table("statement_job")
+    op.drop_index("ix_ledger_entry_account_id_id", table_name="ledger_entry")
+    op.drop_table("ledger_entry")
+    op.drop_table("account")
@@ -0,0 +1,39 @@
+"""statement_job failed_attempts
+
+Revision ID: d5c9a7e41b36
+Revises: b81f5e3d2c07
+Create Date: 2026-10-19 21:14:52.306118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from simple_transactions.operation.db.online_migrations import with_lock_retries
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5c9a7e41b36"
+down_revision: Union[str, None] = "b81f5e3d2c07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with_lock_retries(
+        lambda: op.add_column(
+            "statement_job",
+            sa.Column(
+                "failed_attempts",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            ),
+        ),
+    )
+
+
+def downgrade() -> None:
+    with_lock_retries(lambda: op.drop_column("statement_job", "failed_attempts"))
@@ -0,0 +1,44 @@
+"""account_reconciliation
+
+Revision ID: e7b2f90a6c13
+Revises: c3a9e17d4b58
+Create Date: 2026-10-19 17:08:44.271930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2f90a6c13"
+down_revision: Union[str, None] = "c3a9e17d4b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_reconciliation",
+        sa.Column("account_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "reconciled_balance",
+            sa.Numeric(precision=20, scale=4),
+            nullable=False,
+        ),
+        sa.Column("watermark", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "reconciled_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["account_id"], ["account.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_reconciliation")
@@ -0,0 +1,83 @@
+"""
+Reconcile stored account balances with the ledger.
+
+Mismatches are printed to stdout as JSON lines while shards are processed.
+Exits with code 1 if any mismatch was found.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from simple_transactions.operation.services.reconciliation.engine import Reconciler
+from simple_transactions.operation.settings import settings
+
+
+async def reconcile(args: argparse.Namespace) -> int:
+    """
+    Run reconciliation and stream mismatches to stdout.
+
+    :param args: parsed command line arguments.
+    :return: number of mismatches.
+    """
+    source_engine = create_async_engine(
+        str(settings.replica_db_url),
+        pool_size=args.concurrency + 1,
+    )
+    target_engine = create_async_engine(str(settings.db_url))
+    reconciler = Reconciler(
+        source_factory=async_sessionmaker(source_engine, expire_on_commit=False),
+        target_factory=async_sessionmaker(target_engine, expire_on_commit=False),
+        shard_count=args.shards,
+        concurrency=args.concurrency,
+        settle_seconds=settings.reconcile_settle_seconds,
+        batch_size=settings.reconcile_batch_size,
+        use_snapshot=not args.no_snapshot,
+        full=args.full,
+    )
+
+    started_at = time.monotonic()
+    try:
+        async for mismatch in reconciler.run():
+            print(json.dumps(mismatch.to_dict()), flush=True)
+    finally:
+        await source_engine.dispose()
+        await target_engine.dispose()
+    logger.info(
+        f"Checked {reconciler.checked_accounts} accounts "
+        f"in {time.monotonic() - started_at:.1f}s, "
+        f"found {reconciler.mismatches} mismatches.",
+    )
+    return reconciler.mismatches
+
+
+def main() -> None:
+    """Entrypoint of the reconciliation command."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shards", type=int, default=settings.reconcile_shards)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.reconcile_concurrency,
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore checkpoints and sum the whole ledger",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="don't share an exported snapshot between shards",
+    )
+    mismatches = asyncio.run(reconcile(parser.parse_args()))
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
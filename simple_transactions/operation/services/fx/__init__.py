@@ -0,0 +1,19 @@
+"""Currency conversion service."""
+
+from simple_transactions.operation.services.fx.converter import (
+    Conversion,
+    convert,
+    convert_many,
+)
+from simple_transactions.operation.services.fx.snapshot import (
+    FxRateNotFoundError,
+    RateSnapshot,
+)
+
+__all__ = [
+    "Conversion",
+    "FxRateNotFoundError",
+    "RateSnapshot",
+    "convert",
+    "convert_many",
+]
@@ -0,0 +1,109 @@
+from collections import defaultdict
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from typing import Dict, List, NamedTuple, Sequence
+
+from simple_transactions.operation.services.fx.snapshot import (
+    CurrencyPair,
+    RateSnapshot,
+)
+
+# Number of minor units for currencies which don't use cents.
+# Every currency missing here is assumed to have two decimal places.
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    "BHD": 3,
+    "CLP": 0,
+    "IQD": 3,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+    "VND": 0,
+}
+DEFAULT_EXPONENT = 2
+
+# Precision is high enough to keep ``amount * rate`` exact,
+# so for stored rates the only rounding step is the final quantize.
+_CONTEXT = Context(prec=60, rounding=ROUND_HALF_EVEN)
+
+
+class Conversion(NamedTuple):
+    """Single amount to convert."""
+
+    amount: Decimal
+    source_currency: str
+    target_currency: str
+
+
+def minor_unit(currency: str) -> Decimal:
+    """
+    Get smallest representable amount of currency.
+
+    :param currency: ISO 4217 currency code.
+    :return: quantum for rounding, e.g. ``Decimal("0.01")``.
+    """
+    return Decimal(1).scaleb(-CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT))
+
+
+def convert(
+    snapshot: RateSnapshot,
+    amounts: Sequence[Decimal],
+    source_currency: str,
+    target_currency: str,
+) -> List[Decimal]:
+    """
+    Convert amounts of the same currency pair.
+
+    The rate and the rounding quantum are resolved once for the whole
+    batch. Every result is rounded half-to-even to the minor unit
+    of the target currency.
+
+    :param snapshot: rates to use.
+    :param amounts: amounts in source currency.
+    :param source_currency: currency of the amounts.
+    :param target_currency: currency to convert to.
+    :return: converted amounts in the same order.
+    """
+    rate = snapshot.rate(source_currency, target_currency)
+    quantum = minor_unit(target_currency)
+    multiply = _CONTEXT.multiply
+    return [
+        multiply(amount, rate).quantize(quantum, context=_CONTEXT)
+        for amount in amounts
+    ]
+
+
+def convert_many(
+    snapshot: RateSnapshot,
+    conversions: Sequence[Conversion],
+) -> List[Decimal]:
+    """
+    Convert amounts with mixed currency pairs.
+
+    Conversions are grouped by currency pair and every group
+    is converted with a single call to :func:`convert`.
+
+    :param snapshot: rates to use.
+    :param conversions: amounts to convert.
+    :return: converted amounts in the same order as conversions.
+    """
+    groups: Dict[CurrencyPair, List[int]] = defaultdict(list)
+    for index, conversion in enumerate(conversions):
+        groups[(conversion.source_currency, conversion.target_currency)].append(
+            index,
+        )
+
+    result: List[Decimal] = [Decimal(0)] * len(conversions)
+    for (source_currency, target_currency), indices in groups.items():
+        converted = convert(
+            snapshot,
+            [conversions[index].amount for index in indices],
+            source_currency,
+            target_currency,
+        )
+        for index, amount in zip(indices, converted):
+            result[index] = amount
+    return result
@@ -0,0 +1,16 @@
+from starlette.requests import Request
+
+from simple_transactions.operation.services.fx.snapshot import RateSnapshot
+
+
+def get_fx_rates(request: Request) -> RateSnapshot:
+    """
+    Get current snapshot of fx rates.
+
+    The snapshot is resolved once per request, so all conversions
+    within a request use the same rates even if a refresh happens.
+
+    :param request: current request.
+    :return: rate snapshot.
+    """
+    return request.app.state.fx_rates
@@ -0,0 +1,57 @@
+import asyncio
+import contextlib
+
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from simple_transactions.operation.db.dao.fx_rate_dao import FxRateDAO
+from simple_transactions.operation.services.fx.snapshot import RateSnapshot
+from simple_transactions.operation.settings import settings
+
+
+async def load_rate_snapshot(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> RateSnapshot:
+    """
+    Read the whole fx_rate table into a new snapshot.
+
+    :param session_factory: factory for database sessions.
+    :return: snapshot of current rates.
+    """
+    async with session_factory() as session:
+        models = await FxRateDAO(session).get_all_rates()
+    return RateSnapshot.from_models(models)
+
+
+async def _refresh_rates(app: FastAPI) -> None:  # pragma: no cover
+    while True:
+        await asyncio.sleep(settings.fx_refresh_interval)
+        try:
+            app.state.fx_rates = await load_rate_snapshot(
+                app.state.db_session_factory,
+            )
+        except Exception:
+            logger.exception("Failed to refresh fx rates, keeping old snapshot.")
+
+
+async def init_fx_rates(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Load fx rates and start periodic refresh.
+
+    :param app: current fastapi application.
+    """
+    app.state.fx_rates = await load_rate_snapshot(app.state.db_session_factory)
+    logger.info(f"Loaded {len(app.state.fx_rates.rates)} fx rates.")
+    app.state.fx_refresh_task = asyncio.create_task(_refresh_rates(app))
+
+
+async def shutdown_fx_rates(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Stop refreshing fx rates.
+
+    :param app: current fastapi application.
+    """
+    app.state.fx_refresh_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.fx_refresh_task
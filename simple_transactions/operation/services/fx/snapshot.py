@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from types import MappingProxyType
+from typing import Iterable, Mapping, Tuple
+
+from simple_transactions.operation.db.models.fx_rate import FxRateModel
+
+CurrencyPair = Tuple[str, str]
+
+_ONE = Decimal(1)
+# Inverse rates are rounded to far more digits than any stored rate has.
+_INVERSE_CONTEXT = Context(prec=60, rounding=ROUND_HALF_EVEN)
+
+
+class FxRateNotFoundError(LookupError):
+    """Raised when there is no rate for the requested currency pair."""
+
+    def __init__(self, base_currency: str, quote_currency: str) -> None:
+        super().__init__(f"No exchange rate for {base_currency}/{quote_currency}.")
+        self.base_currency = base_currency
+        self.quote_currency = quote_currency
+
+
+@dataclass(frozen=True)
+class RateSnapshot:
+    """
+    Immutable view of the fx_rate table.
+
+    A snapshot is never modified after creation. Refreshing rates
+    builds a new snapshot and replaces the reference in the application
+    state, so readers always see a consistent set of rates.
+    """
+
+    rates: Mapping[CurrencyPair, Decimal] = field(
+        default_factory=lambda: MappingProxyType({}),
+    )
+    loaded_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc),
+    )
+
+    @classmethod
+    def from_models(cls, models: Iterable[FxRateModel]) -> "RateSnapshot":
+        """
+        Build snapshot from fx_rate rows.
+
+        :param models: rows of the fx_rate table.
+        :return: new snapshot.
+        """
+        rates = {
+            (model.base_currency, model.quote_currency): model.rate
+            for model in models
+        }
+        return cls(rates=MappingProxyType(rates))
+
+    def rate(self, base_currency: str, quote_currency: str) -> Decimal:
+        """
+        Get rate for a currency pair.
+
+        If only the opposite direction is stored, its inverse is used.
+
+        :param base_currency: currency to convert from.
+        :param quote_currency: currency to convert to.
+        :raises FxRateNotFoundError: if the pair is unknown in both directions.
+        :return: price of one unit of base currency in quote currency.
+        """
+        if base_currency == quote_currency:
+            return _ONE
+        rate = self.rates.get((base_currency, quote_currency))
+        if rate is not None:
+            return rate
+        inverse_rate = self.rates.get((quote_currency, base_currency))
+        if inverse_rate:
+            return _INVERSE_CONTEXT.divide(_ONE, inverse_rate)
+        raise FxRateNotFoundError(base_currency, quote_currency)
@@ -0,0 +1,18 @@
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from simple_transactions.operation.services.profiling.store import ProfileStore
+
+
+def get_profile_store(request: Request) -> ProfileStore:
+    """
+    Get profile store of the current worker.
+
+    :param request: current request.
+    :raises HTTPException: if profiling is disabled.
+    :return: profile store.
+    """
+    store = getattr(request.app.state, "profiling", None)
+    if store is None:
+        raise HTTPException(status_code=404, detail="Profiling is disabled.")
+    return store
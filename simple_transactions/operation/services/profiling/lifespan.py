@@ -0,0 +1,53 @@
+import asyncio
+import contextlib
+
+from fastapi import FastAPI
+
+from simple_transactions.operation.services.profiling.sql import (
+    attach_query_listeners,
+)
+from simple_transactions.operation.services.profiling.store import ProfileStore
+from simple_transactions.operation.settings import settings
+
+LOOP_LAG_INTERVAL = 0.5
+
+
+async def _monitor_loop_lag(store: ProfileStore) -> None:  # pragma: no cover
+    loop = asyncio.get_running_loop()
+    while True:
+        started_at = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        store.record_loop_lag(max(0.0, loop.time() - started_at - LOOP_LAG_INTERVAL))
+
+
+def init_profiling(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Create profile store and start collecting timings.
+
+    Does nothing unless profiling is enabled in settings.
+
+    :param app: current fastapi application.
+    """
+    if not settings.profiling_enabled:
+        return
+    store = ProfileStore(settings.profiling_history_size)
+    attach_query_listeners(
+        app.state.db_engine,
+        store,
+        settings.slow_query_threshold,
+    )
+    app.state.profiling = store
+    app.state.loop_lag_task = asyncio.create_task(_monitor_loop_lag(store))
+
+
+async def shutdown_profiling(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Stop event loop lag monitor.
+
+    :param app: current fastapi application.
+    """
+    if not settings.profiling_enabled:
+        return
+    app.state.loop_lag_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.loop_lag_task
@@ -0,0 +1,10 @@
+"""Reconciliation of stored balances against the ledger."""
+
+from simple_transactions.operation.services.reconciliation.engine import (
+    Mismatch,
+    Reconciler,
+    Shard,
+    hash_shards,
+)
+
+__all__ = ["Mismatch", "Reconciler", "Shard", "hash_shards"]
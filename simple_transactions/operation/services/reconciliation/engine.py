@@ -0,0 +1,209 @@
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from simple_transactions.operation.db.dao.reconciliation_dao import ReconciliationDAO
+
+# Range of values returned by postgres ``hashint8``.
+HASH_MIN = -(2**31)
+HASH_MAX = 2**31 - 1
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Range of ``hashint8(account.id)`` values, both bounds inclusive."""
+
+    number: int
+    low: int
+    high: int
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """Account whose stored balance differs from the sum of its postings."""
+
+    account_id: int
+    shard: int
+    stored_balance: Decimal
+    expected_balance: Decimal
+
+    def to_dict(self) -> Dict[str, Union[int, str]]:
+        """
+        Get JSON-serializable representation.
+
+        :return: mismatch as a dict with amounts as strings.
+        """
+        return {
+            "account_id": self.account_id,
+            "shard": self.shard,
+            "stored_balance": str(self.stored_balance),
+            "expected_balance": str(self.expected_balance),
+            "difference": str(self.stored_balance - self.expected_balance),
+        }
+
+
+def hash_shards(count: int) -> List[Shard]:
+    """
+    Split the hash space into ``count`` contiguous ranges.
+
+    :param count: number of shards.
+    :return: list of shards covering all hash values.
+    """
+    step = (HASH_MAX - HASH_MIN + 1) // count
+    shards = []
+    for number in range(count):
+        low = HASH_MIN + number * step
+        high = HASH_MAX if number == count - 1 else low + step - 1
+        shards.append(Shard(number, low, high))
+    return shards
+
+
+class Reconciler:
+    """
+    Checks stored balances against the ledger, shard by shard.
+
+    Every account is checked as
+    ``balance == reconciled_balance + sum(entries after watermark)``,
+    where the checkpoint comes from the last clean run. Clean accounts
+    get their checkpoint advanced up to the settled watermark, so next
+    runs only sum new entries.
+
+    Balances are read from ``source_factory``, which may point to a replica.
+    With ``use_snapshot`` all shards read one exported snapshot, so
+    balances and postings are consistent across shards. Checkpoints
+    are written through ``target_factory``.
+    """
+
+    def __init__(
+        self,
+        source_factory: async_sessionmaker[AsyncSession],
+        target_factory: async_sessionmaker[AsyncSession],
+        shard_count: int,
+        concurrency: int,
+        settle_seconds: int,
+        batch_size: int,
+        use_snapshot: bool = True,
+        full: bool = False,
+    ) -> None:
+        self.source_factory = source_factory
+        self.target_factory = target_factory
+        self.shards = hash_shards(shard_count)
+        self.concurrency = concurrency
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+        self.use_snapshot = use_snapshot
+        self.full = full
+        self.checked_accounts = 0
+        self.mismatches = 0
+
+    async def run(self) -> AsyncIterator[Mismatch]:
+        """
+        Reconcile all shards concurrently.
+
+        :yield: mismatches as soon as they are found.
+        """
+        async with self.source_factory() as coordinator:
+            await coordinator.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"},
+            )
+            dao = ReconciliationDAO(coordinator)
+            snapshot_id = await dao.export_snapshot() if self.use_snapshot else None
+            watermark = await dao.get_settled_watermark(self.settle_seconds)
+
+            queue: "asyncio.Queue[Optional[Mismatch]]" = asyncio.Queue(
+                maxsize=self.batch_size,
+            )
+            semaphore = asyncio.Semaphore(self.concurrency)
+            tasks = [
+                asyncio.create_task(
+                    self._run_shard(shard, snapshot_id, watermark, queue, semaphore),
+                )
+                for shard in self.shards
+            ]
+            try:
+                running = len(tasks)
+                while running:
+                    mismatch = await queue.get()
+                    if mismatch is None:
+                        running -= 1
+                        continue
+                    yield mismatch
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def _run_shard(
+        self,
+        shard: Shard,
+        snapshot_id: Optional[str],
+        watermark: int,
+        queue: "asyncio.Queue[Optional[Mismatch]]",
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            async with semaphore:
+                await self._reconcile_shard(shard, snapshot_id, watermark, queue)
+        finally:
+            await queue.put(None)
+
+    async def _reconcile_shard(
+        self,
+        shard: Shard,
+        snapshot_id: Optional[str],
+        watermark: int,
+        queue: "asyncio.Queue[Optional[Mismatch]]",
+    ) -> None:
+        checkpoints: List[Dict[str, Any]] = []
+        async with self.source_factory() as session:
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"},
+            )
+            dao = ReconciliationDAO(session)
+            if snapshot_id is not None:
+                await dao.use_snapshot(snapshot_id)
+            rows = dao.stream_shard(
+                shard.low,
+                shard.high,
+                watermark,
+                self.full,
+                self.batch_size,
+            )
+            async for row in rows:
+                self.checked_accounts += 1
+                expected_balance = row.reconciled_balance + row.delta
+                if row.balance != expected_balance:
+                    self.mismatches += 1
+                    await queue.put(
+                        Mismatch(
+                            account_id=row.account_id,
+                            shard=shard.number,
+                            stored_balance=row.balance,
+                            expected_balance=expected_balance,
+                        ),
+                    )
+                    continue
+                # Checkpoint moves only forward, to entries known to be settled.
+                if row.settled_count:
+                    checkpoints.append(
+                        {
+                            "account_id": row.account_id,
+                            "reconciled_balance": (
+                                row.reconciled_balance + row.settled_delta
+                            ),
+                            "watermark": watermark,
+                        },
+                    )
+                if len(checkpoints) >= self.batch_size:
+                    await self._save_checkpoints(checkpoints)
+                    checkpoints = []
+        if checkpoints:
+            await self._save_checkpoints(checkpoints)
+
+    async def _save_checkpoints(self, checkpoints: List[Dict[str, Any]]) -> None:
+        async with self.target_factory() as session:
+            await ReconciliationDAO(session).save_checkpoints(checkpoints)
+            await session.commit()
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, TypeVar, Union
+
+ResultType = TypeVar("ResultType")
+
+_groups: List["SingleFlight[object]"] = []
+
+
+class SingleFlight(Generic[ResultType]):
+    """
+    Coalesces concurrent calls with the same key.
+
+    The first caller for a key starts the call, callers arriving
+    while it is in flight wait for the same result or exception.
+    The call runs in its own task, so a cancelled caller doesn't
+    cancel it for the others. Nothing is cached after it finishes.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.requests = 0
+        self.executions = 0
+        self._calls: Dict[Hashable, "asyncio.Task[ResultType]"] = {}
+        _groups.append(self)  # type: ignore
+
+    async def do(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[ResultType]],
+    ) -> ResultType:
+        """
+        Run call for the key, or join the one already in flight.
+
+        :param key: key identifying identical calls.
+        :param call: function starting the call.
+        :return: result of the call.
+        """
+        self.requests += 1
+        task = self._calls.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[ResultType]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark exception as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get coalescing metrics.
+
+        :return: number of requests, executed calls and coalescing ratio.
+        """
+        return {
+            "requests": self.requests,
+            "executions": self.executions,
+            "in_flight": len(self._calls),
+            "coalescing_ratio": (
+                1 - self.executions / self.requests if self.requests else 0.0
+            ),
+        }
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Union[int, float]]]:
+    """
+    Get metrics of all single-flight groups.
+
+    :return: metrics by group name.
+    """
+    return {group.name: group.stats() for group in _groups}
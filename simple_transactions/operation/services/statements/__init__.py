@@ -0,0 +1,7 @@
+"""Background generation of account statements."""
+
+from simple_transactions.operation.services.statements.runner import (
+    StatementJobRunner,
+)
+
+__all__ = ["StatementJobRunner"]
@@ -0,0 +1,15 @@
+from starlette.requests import Request
+
+from simple_transactions.operation.services.statements.runner import (
+    StatementJobRunner,
+)
+
+
+def get_statement_runner(request: Request) -> StatementJobRunner:
+    """
+    Get statement job runner of the current worker.
+
+    :param request: current request.
+    :return: statement job runner.
+    """
+    return request.app.state.statement_runner
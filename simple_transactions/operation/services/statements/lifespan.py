@@ -0,0 +1,49 @@
+import asyncio
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from fastapi import FastAPI
+
+from simple_transactions.operation.services.statements.runner import (
+    StatementJobRunner,
+)
+from simple_transactions.operation.settings import settings
+
+
+def init_statements(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Start process pool and runner for statement jobs.
+
+    Worker processes are spawned rather than forked,
+    so they don't inherit the running event loop and open connections.
+
+    :param app: current fastapi application.
+    """
+    executor = ProcessPoolExecutor(
+        max_workers=settings.statement_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    runner = StatementJobRunner(
+        app.state.db_engine,
+        app.state.db_session_factory,
+        executor,
+    )
+    app.state.statement_executor = executor
+    app.state.statement_runner = runner
+    app.state.statement_runner_task = asyncio.create_task(runner.run_forever())
+
+
+async def shutdown_statements(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Stop statement runner and its process pool.
+
+    Interrupted jobs stay running in the database
+    and are resumed from the last finished chunk on next start.
+
+    :param app: current fastapi application.
+    """
+    app.state.statement_runner_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.statement_runner_task
+    app.state.statement_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,205 @@
+import asyncio
+import contextlib
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from simple_transactions.operation.db.dao.statement_job_dao import StatementJobDAO
+from simple_transactions.operation.db.models.statement_job import (
+    StatementChunkModel,
+    StatementJobModel,
+    StatementJobStatus,
+)
+from simple_transactions.operation.services.statements.worker import build_chunk
+from simple_transactions.operation.settings import settings
+
+# First key of advisory locks held by workers running statement jobs.
+STATEMENT_LOCK_NAMESPACE = 1
+
+
+class StatementJobRunner:
+    """
+    Runs statement jobs on a process pool.
+
+    The runner picks up pending jobs and jobs interrupted by a restart.
+    A job is held with a session-level advisory lock, so with several
+    application workers every job is run by only one of them, and the
+    lock is released by the database if the worker dies.
+
+    A failed chunk is retried, and if it still fails the other chunks
+    are stopped and the job stays running with the error saved.
+    The next poll resumes it from the finished chunks, until the job
+    has failed ``statement_job_attempts`` times and is marked failed.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        session_factory: async_sessionmaker[AsyncSession],
+        executor: Executor,
+    ) -> None:
+        self.engine = engine
+        self.session_factory = session_factory
+        self.executor = executor
+        self._wakeup = asyncio.Event()
+
+    def wake(self) -> None:
+        """Look for new jobs without waiting for the poll interval."""
+        self._wakeup.set()
+
+    async def run_forever(self) -> None:  # pragma: no cover
+        """Run unfinished jobs until cancelled."""
+        while True:
+            try:
+                await self.run_unfinished()
+            except Exception:
+                logger.exception("Failed to run statement jobs.")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    settings.statement_poll_interval,
+                )
+            self._wakeup.clear()
+
+    async def run_unfinished(self) -> None:
+        """Run every job which isn't done and isn't run by another worker."""
+        async with self.session_factory() as session:
+            job_ids = await StatementJobDAO(session).get_unfinished_job_ids()
+        for job_id in job_ids:
+            await self._run_locked(job_id)
+
+    async def _run_locked(self, job_id: int) -> None:
+        lock_params = {"namespace": STATEMENT_LOCK_NAMESPACE, "job_id": job_id}
+        async with self.engine.connect() as lock_connection:
+            locked = await lock_connection.scalar(
+                text("SELECT pg_try_advisory_lock(:namespace, :job_id)"),
+                lock_params,
+            )
+            # Session-level lock outlives the transaction, don't keep it open.
+            await lock_connection.commit()
+            if not locked:
+                return
+            try:
+                await self._run_job(job_id)
+            finally:
+                await lock_connection.execute(
+                    text("SELECT pg_advisory_unlock(:namespace, :job_id)"),
+                    lock_params,
+                )
+                await lock_connection.commit()
+
+    async def _run_job(self, job_id: int) -> None:
+        async with self.session_factory() as session:
+            dao = StatementJobDAO(session)
+            job = await dao.get_job(job_id)
+            if job is None or job.status not in {
+                StatementJobStatus.PENDING.value,
+                StatementJobStatus.RUNNING.value,
+            }:
+                return
+            if job.total_chunks is None:
+                await dao.plan_chunks(job, settings.statement_chunk_size)
+            job.status = StatementJobStatus.RUNNING.value
+            chunks = await dao.get_pending_chunks(job_id)
+            await session.commit()
+
+        logger.info(
+            f"Running statement job {job_id}: "
+            f"{len(chunks)} of {job.total_chunks} chunks left.",
+        )
+        tasks = [asyncio.create_task(self._run_chunk(job, chunk)) for chunk in chunks]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception as exc:
+            await self._stop_chunks(tasks)
+            async with self.session_factory() as session:
+                status = await StatementJobDAO(session).record_failure(
+                    job_id,
+                    str(exc),
+                    settings.statement_job_attempts,
+                )
+                await session.commit()
+            if status == StatementJobStatus.FAILED:
+                logger.exception(f"Statement job {job_id} failed.")
+            else:
+                logger.exception(f"Statement job {job_id} failed, it will be resumed.")
+            return
+        except asyncio.CancelledError:
+            await self._stop_chunks(tasks)
+            raise
+        await self._set_status(job_id, StatementJobStatus.DONE)
+        logger.info(f"Statement job {job_id} is done.")
+
+    @staticmethod
+    async def _stop_chunks(tasks: "List[asyncio.Task[None]]") -> None:
+        # Wait for every chunk, so the job lock isn't released
+        # while some chunk is still being written.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_chunk(
+        self,
+        job: StatementJobModel,
+        chunk: StatementChunkModel,
+    ) -> None:
+        output_path = Path(
+            settings.statements_dir,
+            str(job.id),
+            f"chunk_{chunk.chunk_no:06d}.csv.gz",
+        )
+        build = partial(
+            build_chunk,
+            db_url=str(settings.sync_db_url),
+            output_path=str(output_path),
+            first_account_id=chunk.first_account_id,
+            last_account_id=chunk.last_account_id,
+            period_start=job.period_start,
+            period_end=job.period_end,
+            fetch_size=settings.statement_fetch_size,
+        )
+        for attempt in range(1, settings.statement_chunk_attempts + 1):
+            try:
+                rows = await self._build_in_executor(build)
+                break
+            except Exception:
+                if attempt == settings.statement_chunk_attempts:
+                    raise
+                logger.warning(
+                    f"Chunk {chunk.chunk_no} of statement job {job.id} "
+                    f"failed on attempt {attempt}, retrying.",
+                )
+        async with self.session_factory() as session:
+            await StatementJobDAO(session).mark_chunk_done(
+                job.id,
+                chunk.chunk_no,
+                str(output_path),
+                rows,
+            )
+            await session.commit()
+
+    async def _build_in_executor(self, build: Callable[[], int]) -> int:
+        future = self.executor.submit(build)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A chunk already running in a worker process can't be interrupted.
+            if not future.cancel():
+                with contextlib.suppress(Exception):
+                    await asyncio.wrap_future(future)
+            raise
+
+    async def _set_status(
+        self,
+        job_id: int,
+        status: StatementJobStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        async with self.session_factory() as session:
+            await StatementJobDAO(session).set_status(job_id, status, error)
+            await session.commit()
@@ -0,0 +1,87 @@
+"""
+Functions executed in statement worker processes.
+
+Worker processes use their own synchronous engine,
+created once per process on first use.
+"""
+
+import csv
+import gzip
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict
+
+from sqlalchemy import Engine, create_engine, select
+
+from simple_transactions.operation.db.models.ledger_entry import LedgerEntryModel
+
+STATEMENT_HEADER = ("account_id", "entry_id", "created_at", "amount")
+
+_engines: Dict[str, Engine] = {}
+
+
+def _get_engine(db_url: str) -> Engine:
+    if db_url not in _engines:
+        _engines[db_url] = create_engine(db_url, pool_size=1, max_overflow=0)
+    return _engines[db_url]
+
+
+def build_chunk(
+    db_url: str,
+    output_path: str,
+    first_account_id: int,
+    last_account_id: int,
+    period_start: date,
+    period_end: date,
+    fetch_size: int,
+) -> int:
+    """
+    Write statements of a range of accounts to a gzipped CSV file.
+
+    Ledger entries are streamed with a server-side cursor, so memory
+    usage doesn't depend on the number of entries. The file is written
+    under a temporary name and renamed when complete, so an interrupted
+    chunk never leaves a truncated statement behind.
+
+    :param db_url: synchronous database URL.
+    :param output_path: path of the statement file.
+    :param first_account_id: first account of the chunk.
+    :param last_account_id: last account of the chunk.
+    :param period_start: first day of the period.
+    :param period_end: day after the last day of the period.
+    :param fetch_size: number of rows fetched from the cursor at once.
+    :return: number of written entries.
+    """
+    query = (
+        select(
+            LedgerEntryModel.account_id,
+            LedgerEntryModel.id,
+            LedgerEntryModel.created_at,
+            LedgerEntryModel.amount,
+        )
+        .where(
+            LedgerEntryModel.account_id.between(first_account_id, last_account_id),
+            LedgerEntryModel.created_at >= period_start,
+            LedgerEntryModel.created_at < period_end,
+        )
+        .order_by(LedgerEntryModel.account_id, LedgerEntryModel.id)
+    )
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(f"{path.name}.partial")
+
+    rows = 0
+    with _get_engine(db_url).connect() as connection:
+        result = connection.execution_options(
+            stream_results=True,
+            yield_per=fetch_size,
+        ).execute(query)
+        with gzip.open(partial_path, "wt", newline="") as statement_file:
+            writer = csv.writer(statement_file)
+            writer.writerow(STATEMENT_HEADER)
+            for row in result:
+                writer.writerow(row)
+                rows += 1
+    os.replace(partial_path, path)
+    return rows
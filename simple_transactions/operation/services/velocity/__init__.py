@@ -0,0 +1,9 @@
+"""Velocity limits on outgoing transfers."""
+
+from simple_transactions.operation.services.velocity.checker import (
+    VelocityChecker,
+    VelocityLimitExceeded,
+)
+from simple_transactions.operation.services.velocity.window import WindowCounter
+
+__all__ = ["VelocityChecker", "VelocityLimitExceeded", "WindowCounter"]
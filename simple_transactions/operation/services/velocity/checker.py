@@ -0,0 +1,259 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from simple_transactions.operation.db.dao.ledger_dao import LedgerDAO
+from simple_transactions.operation.services.single_flight import SingleFlight
+from simple_transactions.operation.services.velocity.window import WindowCounter
+from simple_transactions.operation.settings import VelocityRule
+
+# Amounts are counted in units of the last digit of ledger amounts.
+AMOUNT_SCALE = 4
+
+
+def to_units(amount: Decimal) -> int:
+    """
+    Convert amount to integer units.
+
+    :param amount: amount of money.
+    :return: absolute amount in 10^-4 units.
+    """
+    return abs(int(amount.scaleb(AMOUNT_SCALE)))
+
+
+class VelocityLimitExceeded(Exception):
+    """Raised when a transfer would break a velocity rule."""
+
+    def __init__(self, account_id: int, rule: VelocityRule) -> None:
+        super().__init__(
+            f"Account {account_id} exceeds velocity limit {rule.name!r}.",
+        )
+        self.account_id = account_id
+        self.rule = rule
+
+
+class VelocityChecker:
+    """
+    Evaluates velocity rules against in-memory sliding windows.
+
+    Counters of an account are seeded from the ledger when the account
+    is first checked. Afterwards rules are evaluated in memory only.
+    Every worker counts only its own transfers, so :meth:`flush`
+    periodically merges ledger entries created since the previous read
+    to pick up transfers made through other workers, and forgets
+    accounts idle for longer than the longest window.
+
+    The ledger is read after an entry id watermark. A seeded account
+    already counts entries up to the newest one at seeding time, so
+    they are skipped by flushes. Transfers counted locally stay pending
+    until a flush reads a ledger entry of the same account and amount,
+    which replaces them. A pending transfer not read by two flushes is
+    assumed to be rolled back. An entry committed after an entry with
+    a higher id was read is never counted.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[VelocityRule],
+        buckets: int,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self.buckets = buckets
+        self.session_factory = session_factory
+        # Rule, bucket length and amount limit in units.
+        self._rules: List[Tuple[VelocityRule, float, Optional[int]]] = [
+            (
+                rule,
+                rule.window_seconds / buckets,
+                None if rule.max_amount is None else to_units(rule.max_amount),
+            )
+            for rule in rules
+        ]
+        self._windows: Dict[int, Dict[int, WindowCounter]] = {
+            rule.window_seconds: {} for rule in rules
+        }
+        self._last_seen: Dict[int, float] = {}
+        # Locally counted transfers not read from the ledger yet,
+        # as (unix timestamp, units) by account.
+        self._pending: Dict[int, List[Tuple[float, int]]] = {}
+        # Id of the last ledger entry merged into counters.
+        self._watermark: Optional[int] = None
+        # Id of the newest entry counted by seeding, for accounts
+        # seeded after the watermark.
+        self._seeded_until: Dict[int, int] = {}
+        self._previous_flush_at: Optional[float] = None
+        # Seeding and flushes both move counters to the watermark.
+        self._ledger_lock = asyncio.Lock()
+        self._seeding: SingleFlight[None] = SingleFlight("velocity_seed")
+
+    async def admit(
+        self,
+        account_id: int,
+        amount: Decimal,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Check outgoing transfer and count it if it is allowed.
+
+        :param account_id: id of the debited account.
+        :param amount: transfer amount.
+        :param now: unix timestamp of the transfer, defaults to current time.
+        :raises VelocityLimitExceeded: if the transfer breaks a rule.
+        """
+        now = time.time() if now is None else now
+        if account_id not in self._last_seen:
+            await self._seeding.do(account_id, lambda: self._seed([account_id], now))
+        units = to_units(amount)
+        self.evaluate(account_id, units, now)
+        self.record(account_id, units, now)
+
+    def evaluate(self, account_id: int, units: int, now: float) -> None:
+        """
+        Check rules for a seeded account.
+
+        :param account_id: id of the debited account.
+        :param units: transfer amount in units, see :func:`to_units`.
+        :param now: unix timestamp of the transfer.
+        :raises VelocityLimitExceeded: if the transfer breaks a rule.
+        """
+        for rule, bucket_seconds, max_units in self._rules:
+            counter = self._windows[rule.window_seconds][account_id]
+            counter.advance(int(now // bucket_seconds))
+            if rule.max_count is not None and counter.count >= rule.max_count:
+                raise VelocityLimitExceeded(account_id, rule)
+            if max_units is not None and counter.amount + units > max_units:
+                raise VelocityLimitExceeded(account_id, rule)
+
+    def record(self, account_id: int, units: int, now: float) -> None:
+        """
+        Count transfer in all windows of a seeded account.
+
+        :param account_id: id of the debited account.
+        :param units: transfer amount in units, see :func:`to_units`.
+        :param now: unix timestamp of the transfer.
+        """
+        self._last_seen[account_id] = now
+        self._pending.setdefault(account_id, []).append((now, units))
+        self._add(account_id, now, 1, units)
+
+    async def flush(self, now: Optional[float] = None) -> None:
+        """
+        Merge ledger entries created since the previous read.
+
+        Only entries after the watermark are read, and they are added
+        to the counters, so transfers counted while the ledger is read
+        are kept. An entry matching a pending transfer of this worker
+        replaces it instead of being counted again.
+
+        :param now: current unix timestamp, defaults to current time.
+        """
+        async with self._ledger_lock:
+            now = time.time() if now is None else now
+            self._forget_idle(now)
+            if not self._last_seen:
+                # Nothing is counted, next seeding starts a new watermark.
+                self._watermark = None
+                self._previous_flush_at = None
+                return
+            async with self.session_factory() as session:
+                dao = LedgerDAO(session)
+                until_id = await dao.get_last_entry_id()
+                after_id = until_id if self._watermark is None else self._watermark
+                transfers = await dao.get_outgoing_transfers(
+                    list(self._last_seen),
+                    after_id,
+                    until_id,
+                )
+            for transfer in transfers:
+                if transfer.id <= self._seeded_until.get(transfer.account_id, 0):
+                    continue
+                units = to_units(transfer.amount)
+                if self._take_pending(transfer.account_id, units):
+                    continue
+                self._add(transfer.account_id, float(transfer.created_at), 1, units)
+            self._watermark = max(after_id, until_id)
+            self._seeded_until = {
+                account_id: seeded_until
+                for account_id, seeded_until in self._seeded_until.items()
+                if seeded_until > self._watermark
+            }
+            self._expire_pending(self._previous_flush_at)
+            self._previous_flush_at = now
+
+    def _take_pending(self, account_id: int, units: int) -> bool:
+        pending = self._pending.get(account_id, [])
+        for index, (_, pending_units) in enumerate(pending):
+            if pending_units == units:
+                del pending[index]
+                if not pending:
+                    del self._pending[account_id]
+                return True
+        return False
+
+    def _expire_pending(self, counted_before: Optional[float]) -> None:
+        if counted_before is None:
+            return
+        for account_id, pending in list(self._pending.items()):
+            for counted_at, units in pending:
+                if counted_at < counted_before:
+                    self._add(account_id, counted_at, -1, -units)
+            pending = [entry for entry in pending if entry[0] >= counted_before]
+            if pending:
+                self._pending[account_id] = pending
+            else:
+                del self._pending[account_id]
+
+    def _forget_idle(self, now: float) -> None:
+        max_window = max(self._windows, default=0)
+        for account_id, last_seen in list(self._last_seen.items()):
+            if now - last_seen > max_window:
+                del self._last_seen[account_id]
+                self._pending.pop(account_id, None)
+                self._seeded_until.pop(account_id, None)
+                for counters in self._windows.values():
+                    counters.pop(account_id, None)
+
+    def _add(self, account_id: int, timestamp: float, count: int, units: int) -> None:
+        for window_seconds, counters in self._windows.items():
+            counter = counters.get(account_id)
+            if counter is not None:
+                bucket_seconds = window_seconds / self.buckets
+                counter.add(int(timestamp // bucket_seconds), count, units)
+
+    async def _seed(self, account_ids: List[int], now: float) -> None:
+        loaded: Dict[int, Dict[int, WindowCounter]] = {}
+        async with self._ledger_lock:
+            async with self.session_factory() as session:
+                dao = LedgerDAO(session)
+                seeded_until = await dao.get_last_entry_id()
+                for window_seconds in self._windows:
+                    bucket_seconds = window_seconds / self.buckets
+                    epoch = int(now // bucket_seconds)
+                    counters = {
+                        account_id: WindowCounter(self.buckets, epoch)
+                        for account_id in account_ids
+                    }
+                    buckets = await dao.get_outgoing_buckets(
+                        account_ids,
+                        now - window_seconds,
+                        bucket_seconds,
+                        seeded_until,
+                    )
+                    for bucket in buckets:
+                        counters[bucket.account_id].add(
+                            bucket.epoch,
+                            bucket.transfers,
+                            to_units(bucket.amount),
+                        )
+                    loaded[window_seconds] = counters
+            for window_seconds, counters in loaded.items():
+                self._windows[window_seconds].update(counters)
+            if self._watermark is None:
+                self._watermark = seeded_until
+            for account_id in account_ids:
+                self._last_seen.setdefault(account_id, now)
+                if seeded_until > self._watermark:
+                    self._seeded_until[account_id] = seeded_until
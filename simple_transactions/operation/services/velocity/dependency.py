@@ -0,0 +1,16 @@
+from starlette.requests import Request
+
+from simple_transactions.operation.services.velocity.checker import VelocityChecker
+
+
+def get_velocity_checker(request: Request) -> VelocityChecker:
+    """
+    Get velocity checker of the current worker.
+
+    Transfer handlers call ``admit`` with the debited account
+    before the transfer is written.
+
+    :param request: current request.
+    :return: velocity checker.
+    """
+    return request.app.state.velocity_checker
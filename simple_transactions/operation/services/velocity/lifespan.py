@@ -0,0 +1,43 @@
+import asyncio
+import contextlib
+
+from fastapi import FastAPI
+from loguru import logger
+
+from simple_transactions.operation.services.velocity.checker import VelocityChecker
+from simple_transactions.operation.settings import settings
+
+
+async def _flush_periodically(checker: VelocityChecker) -> None:  # pragma: no cover
+    while True:
+        await asyncio.sleep(settings.velocity_flush_interval)
+        try:
+            await checker.flush()
+        except Exception:
+            logger.exception("Failed to flush velocity counters.")
+
+
+def init_velocity(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Create velocity checker and start periodic flushes.
+
+    :param app: current fastapi application.
+    """
+    checker = VelocityChecker(
+        settings.velocity_rules,
+        settings.velocity_buckets,
+        app.state.db_session_factory,
+    )
+    app.state.velocity_checker = checker
+    app.state.velocity_flush_task = asyncio.create_task(_flush_periodically(checker))
+
+
+async def shutdown_velocity(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Stop periodic flushes.
+
+    :param app: current fastapi application.
+    """
+    app.state.velocity_flush_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.velocity_flush_task
@@ -0,0 +1,62 @@
+from array import array
+
+
+class WindowCounter:
+    """
+    Sliding window of transfer counts and amounts of one account.
+
+    The window is a ring buffer of fixed-size time buckets with running
+    totals, so reading the window doesn't iterate over buckets.
+    Buckets are identified by their epoch, ``int(timestamp // bucket_seconds)``.
+    """
+
+    __slots__ = ("counts", "amounts", "head", "count", "amount")
+
+    def __init__(self, size: int, epoch: int) -> None:
+        self.counts = array("q", bytes(8 * size))
+        self.amounts = array("q", bytes(8 * size))
+        self.head = epoch
+        self.count = 0
+        self.amount = 0
+
+    def advance(self, epoch: int) -> None:
+        """
+        Move window forward, dropping buckets which fell out of it.
+
+        :param epoch: current bucket epoch.
+        """
+        if epoch <= self.head:
+            return
+        size = len(self.counts)
+        if epoch - self.head >= size:
+            self.counts = array("q", bytes(8 * size))
+            self.amounts = array("q", bytes(8 * size))
+            self.count = 0
+            self.amount = 0
+        else:
+            for expired in range(self.head + 1, epoch + 1):
+                index = expired % size
+                self.count -= self.counts[index]
+                self.amount -= self.amounts[index]
+                self.counts[index] = 0
+                self.amounts[index] = 0
+        self.head = epoch
+
+    def add(self, epoch: int, count: int, amount: int) -> None:
+        """
+        Add transfers to a bucket.
+
+        Transfers older than the window are ignored.
+
+        :param epoch: bucket epoch of the transfers.
+        :param count: number of transfers.
+        :param amount: total amount in minor units.
+        """
+        if epoch <= self.head - len(self.counts):
+            return
+        self.advance(epoch)
+        index = epoch % len(self.counts)
+        self.counts[index] += count
+        self.amounts[index] += amount
+        self.count += count
+        self.amount += amount
@@ -1,7 +1,10 @@
 import enum
+from decimal import Decimal
 from pathlib import Path
 from tempfile import gettempdir
+from typing import List, Optional
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
 
@@ -19,6 +22,31 @@ class LogLevel(str, enum.Enum):
     FATAL = "FATAL"
 
 
+class LoopType(str, enum.Enum):
+    """Event loop implementations supported by uvicorn."""
+
+    AUTO = "auto"
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+class HttpType(str, enum.Enum):
+    """HTTP protocol implementations supported by uvicorn."""
+
+    AUTO = "auto"
+    H11 = "h11"
+    HTTPTOOLS = "httptools"
+
+
+class VelocityRule(BaseModel):
+    """Limit on outgoing transfers of an account within a sliding window."""
+
+    name: str
+    window_seconds: int = 3600
+    max_count: Optional[int] = None
+    max_amount: Optional[Decimal] = None
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -35,6 +63,15 @@ class Settings(BaseSettings):
     workers_count: int = 1
     # Enable uvicorn reloading
     reload: bool = False
+    # Event loop and HTTP parser, "auto" prefers uvloop and httptools if installed
+    loop: LoopType = LoopType.AUTO
+    http: HttpType = HttpType.AUTO
+    # Maximum number of pending connections
+    backlog: int = 2048
+    # Seconds to keep idle connections open
+    timeout_keep_alive: int = 5
+    # Maximum number of connections and tasks before responding with 503
+    limit_concurrency: Optional[int] = None
 
     # Current environment
     environment: str = "dev"
@@ -48,6 +85,73 @@ class Settings(BaseSettings):
     db_base: str = "simple_transactions"
     db_echo: bool = False
 
+    # Optional read replica, used by reconciliation instead of the primary
+    replica_db_host: Optional[str] = None
+    replica_db_port: Optional[int] = None
+
+    # Reconciliation: number of hash shards, shards reconciled at once,
+    # age in seconds after which ledger entries are considered settled
+    reconcile_shards: int = 16
+    reconcile_concurrency: int = 4
+    reconcile_settle_seconds: int = 60
+    reconcile_batch_size: int = 1000
+
+    # Interval in seconds between reloads of the fx rate table
+    fx_refresh_interval: int = 60
+
+    # Admission control: per route class limit of in-flight requests,
+    # adapted to keep average pool wait under admission_target_pool_wait
+    admission_initial_limit: int = 50
+    admission_min_limit: int = 4
+    admission_max_limit: int = 200
+    # Seconds a request may wait for a slot before it is shed with 503
+    admission_queue_timeout: float = 0.5
+    admission_retry_after: int = 1
+    admission_target_pool_wait: float = 0.05
+
+    # Velocity rules, as a JSON list in the environment, e.g.
+    # [{"name": "hourly", "window_seconds": 3600, "max_count": 20}]
+    velocity_rules: List[VelocityRule] = []
+    # Number of buckets every window is split into
+    velocity_buckets: int = 60
+    # Interval in seconds between reloads of counters from the ledger
+    velocity_flush_interval: int = 10
+
+    # Statement jobs: accounts per chunk, worker processes and output directory
+    statement_chunk_size: int = 1000
+    statement_workers: int = 2
+    statement_fetch_size: int = 5000
+    statement_poll_interval: int = 30
+    statements_dir: Path = TEMP_DIR / "statements"
+    # Attempts of a chunk before the job is left for the next poll
+    statement_chunk_attempts: int = 3
+    # Failed runs of a job before it is marked failed and not resumed
+    statement_job_attempts: int = 5
+
+    # Token expected in the X-Admin-Token header by /admin endpoints.
+    # They expose SQL text of slow queries, so they are disabled if it is unset.
+    admin_token: Optional[str] = None
+
+    # Opt-in profiling of sampled requests and slow query capture
+    profiling_enabled: bool = False
+    # Profile every N-th request, 0 profiles only requests with the header
+    profiling_sample_rate: int = 0
+    profiling_header: str = "X-Profile"
+    # Number of kept profiles and slow queries
+    profiling_history_size: int = 100
+    # Queries slower than this many seconds are saved with their plan
+    slow_query_threshold: float = 0.5
+
+    # Migrations: lock_timeout in milliseconds and retries on its expiry
+    migration_lock_timeout: int = 5000
+    migration_lock_retries: int = 5
+    migration_lock_retry_backoff: float = 1.0
+    # Batched backfills: rows per batch and pause in seconds between batches
+    migration_backfill_batch_size: int = 10_000
+    migration_backfill_pause: float = 0.1
+    # Render pending migrations as SQL and report their locks without running them
+    migration_dry_run: bool = False
+
     # Location of alembic.ini
     alembic_ini: str = "alembic.ini"
     alembic_folder: str = "simple_transactions/operation/migration"
@@ -88,6 +192,22 @@ class Settings(BaseSettings):
             path=f"/{self.db_base}",
         )
 
+    @property
+    def replica_db_url(self) -> URL:
+        """
+        Assemble read replica URL, falling back to the primary.
+
+        :return: database URL.
+        """
+        return URL.build(
+            scheme="postgresql+asyncpg",
+            host=self.replica_db_host or self.db_host,
+            port=self.replica_db_port or self.db_port,
+            user=self.db_user,
+            password=self.db_pass,
+            path=f"/{self.db_base}",
+        )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_prefix="SIMPLE_TRANSACTIONS_",
@@ -0,0 +1,187 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from simple_transactions.operation.web.admission import (
+    AdaptiveLimiter,
+    AdmissionControlMiddleware,
+)
+
+
+def test_acquire_takes_free_slot() -> None:
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=10)
+
+    async def run() -> None:
+        assert await limiter.acquire(timeout=0.01)
+        assert not await limiter.acquire(timeout=0.01)
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    asyncio.run(run())
+
+
+def test_release_grants_slot_to_waiter() -> None:
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=10)
+
+    async def run() -> None:
+        await limiter.acquire(timeout=0.01)
+        waiting = asyncio.create_task(limiter.acquire(timeout=1))
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+
+        limiter.release()
+
+        assert await waiting
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    asyncio.run(run())
+
+
+def test_slot_granted_right_before_timeout_is_kept(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=10)
+    wait_for = asyncio.wait_for
+
+    async def wait_for_granted_late(future: Any, timeout: float) -> None:
+        # The slot is handed over in the same loop iteration
+        # as the timeout fires.
+        limiter.release()
+        await asyncio.sleep(0)
+        raise asyncio.TimeoutError
+
+    async def run() -> None:
+        await limiter.acquire(timeout=0.01)
+        monkeypatch.setattr(asyncio, "wait_for", wait_for_granted_late)
+        try:
+            assert await limiter.acquire(timeout=0.01)
+        finally:
+            monkeypatch.setattr(asyncio, "wait_for", wait_for)
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_gives_back_granted_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=10)
+    wait_for = asyncio.wait_for
+
+    async def wait_for_cancelled_after_grant(future: Any, timeout: float) -> None:
+        # The slot is handed over, but the request is cancelled
+        # before it wakes up.
+        limiter.release()
+        await asyncio.sleep(0)
+        raise asyncio.CancelledError
+
+    async def run() -> None:
+        await limiter.acquire(timeout=0.01)
+        monkeypatch.setattr(asyncio, "wait_for", wait_for_cancelled_after_grant)
+        try:
+            with pytest.raises(asyncio.CancelledError):
+                await limiter.acquire(timeout=1)
+        finally:
+            monkeypatch.setattr(asyncio, "wait_for", wait_for)
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_leaves_queue() -> None:
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=10)
+
+    async def run() -> None:
+        await limiter.acquire(timeout=0.01)
+        waiting = asyncio.create_task(limiter.acquire(timeout=1))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    asyncio.run(run())
+
+
+def test_adjust_shrinks_and_grows_limit() -> None:
+    limiter = AdaptiveLimiter(limit=20, min_limit=15, max_limit=22)
+
+    limiter.adjust(pool_wait=0.1, target_pool_wait=0.05)
+    assert limiter.limit == 18
+    limiter.adjust(pool_wait=0.1, target_pool_wait=0.05)
+    assert limiter.limit == 16
+    limiter.adjust(pool_wait=0.1, target_pool_wait=0.05)
+    assert limiter.limit == 15
+
+    for _ in range(10):
+        limiter.adjust(pool_wait=0.01, target_pool_wait=0.05)
+    assert limiter.limit == 22
+
+
+def test_growing_limit_wakes_waiters() -> None:
+    limiter = AdaptiveLimiter(limit=1, min_limit=1, max_limit=10)
+
+    async def run() -> None:
+        await limiter.acquire(timeout=0.01)
+        waiting = asyncio.create_task(limiter.acquire(timeout=1))
+        await asyncio.sleep(0)
+
+        limiter.adjust(pool_wait=0.0, target_pool_wait=0.05)
+
+        assert await waiting
+        assert limiter.in_flight == 2
+
+    asyncio.run(run())
+
+
+def test_middleware_sheds_load_with_retry_after() -> None:
+    calls: List[str] = []
+
+    async def app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        calls.append(scope["path"])
+
+    middleware = AdmissionControlMiddleware(
+        app,
+        initial_limit=1,
+        min_limit=1,
+        max_limit=1,
+        queue_timeout=0.01,
+        retry_after=7,
+        target_pool_wait=0.05,
+        adjust_interval=3600,
+    )
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    def scope(method: str, path: str) -> Dict[str, Any]:
+        return {"type": "http", "method": method, "path": path, "headers": []}
+
+    async def run() -> None:
+        await middleware.limiters["write"].acquire(timeout=0.01)
+        await middleware(scope("POST", "/api/transfers"), receive, send)
+        # Other route class and exempt paths are not limited.
+        await middleware(scope("GET", "/api/accounts/1"), receive, send)
+        await middleware(scope("POST", "/health"), receive, send)
+
+    asyncio.run(run())
+
+    start = messages[0]
+    assert start["status"] == 503
+    assert (b"retry-after", b"7") in start["headers"]
+    assert calls == ["/api/accounts/1", "/health"]
+    assert middleware.limiters["read"].in_flight == 0
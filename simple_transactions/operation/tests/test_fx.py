@@ -0,0 +1,84 @@
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+
+from simple_transactions.operation.services.fx.converter import (
+    Conversion,
+    convert,
+    convert_many,
+)
+from simple_transactions.operation.services.fx.snapshot import (
+    FxRateNotFoundError,
+    RateSnapshot,
+)
+
+
+@pytest.fixture
+def snapshot() -> RateSnapshot:
+    return RateSnapshot(
+        rates=MappingProxyType(
+            {
+                ("EUR", "USD"): Decimal("1.1"),
+                ("USD", "JPY"): Decimal("150.5"),
+                ("USD", "KWD"): Decimal("0.3075"),
+            },
+        ),
+    )
+
+
+def test_convert_rounds_half_even_to_minor_unit(snapshot: RateSnapshot) -> None:
+    amounts = [Decimal("0.05"), Decimal("0.15"), Decimal("0.25"), Decimal("10")]
+
+    converted = convert(snapshot, amounts, "EUR", "USD")
+
+    # 0.055 -> 0.06, 0.165 -> 0.16, 0.275 -> 0.28
+    assert converted == [
+        Decimal("0.06"),
+        Decimal("0.16"),
+        Decimal("0.28"),
+        Decimal("11.00"),
+    ]
+
+
+def test_convert_uses_exponent_of_target_currency(snapshot: RateSnapshot) -> None:
+    assert convert(snapshot, [Decimal("1.01")], "USD", "JPY") == [Decimal("152")]
+    assert convert(snapshot, [Decimal("1.01")], "USD", "KWD") == [Decimal("0.311")]
+
+
+def test_convert_same_currency_only_rounds(snapshot: RateSnapshot) -> None:
+    assert convert(snapshot, [Decimal("2.345")], "USD", "USD") == [Decimal("2.34")]
+
+
+def test_convert_falls_back_to_inverse_rate(snapshot: RateSnapshot) -> None:
+    assert convert(snapshot, [Decimal("11")], "USD", "EUR") == [Decimal("10.00")]
+
+
+def test_convert_unknown_pair_raises(snapshot: RateSnapshot) -> None:
+    with pytest.raises(FxRateNotFoundError) as exc_info:
+        convert(snapshot, [Decimal(1)], "EUR", "JPY")
+
+    assert exc_info.value.base_currency == "EUR"
+    assert exc_info.value.quote_currency == "JPY"
+
+
+def test_convert_many_keeps_order_across_pairs(snapshot: RateSnapshot) -> None:
+    conversions = [
+        Conversion(Decimal("1"), "USD", "JPY"),
+        Conversion(Decimal("10"), "EUR", "USD"),
+        Conversion(Decimal("2"), "USD", "JPY"),
+        Conversion(Decimal("1"), "USD", "KWD"),
+        Conversion(Decimal("20"), "EUR", "USD"),
+    ]
+
+    assert convert_many(snapshot, conversions) == [
+        Decimal("150"),
+        Decimal("11.00"),
+        Decimal("301"),
+        Decimal("0.308"),
+        Decimal("22.00"),
+    ]
+
+
+def test_convert_many_empty(snapshot: RateSnapshot) -> None:
+    assert convert_many(snapshot, []) == []
@@ -0,0 +1,153 @@
+import io
+from pathlib import Path
+from textwrap import dedent, indent
+from typing import Dict, List
+
+import pytest
+from alembic import command
+from alembic.config import Config
+
+from simple_transactions.operation.db.online_migrations import (
+    Lock,
+    report_locks,
+    statement_locks,
+)
+
+ENV = """
+from alembic import context
+
+context.configure(
+    url="postgresql://",
+    literal_binds=True,
+    dialect_opts={"paramstyle": "named"},
+)
+with context.begin_transaction():
+    context.run_migrations()
+"""
+
+REVISIONS = {
+    "0001": """
+        op.create_table(
+            "account",
+            sa.Column("id", sa.BigInteger(), primary_key=True),
+        )
+        op.create_table(
+            "ledger_entry",
+            sa.Column("id", sa.BigInteger(), primary_key=True),
+            sa.Column("account_id", sa.BigInteger(), sa.ForeignKey("account.id")),
+        )
+    """,
+    "0002": """
+        op.add_column("account", sa.Column("currency", sa.String(3)))
+    """,
+    "0003": """
+        create_index_concurrently(
+            "ix_ledger_entry_account_id",
+            "ledger_entry",
+            ["account_id"],
+        )
+    """,
+    "0004": """
+        op.execute(
+            "CREATE TABLE refresh_token_p20260101 PARTITION OF refresh_token "
+            "FOR VALUES FROM ('2026-01-01') TO ('2026-01-02')"
+        )
+    """,
+}
+
+REVISION_TEMPLATE = """
+import sqlalchemy as sa
+from alembic import op
+
+from simple_transactions.operation.db.online_migrations import (
+    create_index_concurrently,
+)
+
+revision = "{revision}"
+down_revision = {down_revision}
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+{body}
+
+
+def downgrade():
+    pass
+"""
+
+
+@pytest.fixture
+def offline_sql(tmp_path: Path) -> str:
+    versions = tmp_path / "versions"
+    versions.mkdir()
+    (tmp_path / "env.py").write_text(ENV)
+    down_revision = None
+    for revision, body in REVISIONS.items():
+        (versions / f"{revision}.py").write_text(
+            REVISION_TEMPLATE.format(
+                revision=revision,
+                down_revision=repr(down_revision),
+                body=indent(dedent(body).strip("\n"), "    "),
+            ),
+        )
+        down_revision = revision
+
+    output_buffer = io.StringIO()
+    config = Config(output_buffer=output_buffer)
+    config.set_main_option("script_location", str(tmp_path))
+    command.upgrade(config, "head", sql=True)
+    return output_buffer.getvalue()
+
+
+def test_report_locks_of_offline_migrations(offline_sql: str) -> None:
+    expected: Dict[str, List[Lock]] = {
+        "upgrade  -> 0001": [
+            ("account", "ACCESS EXCLUSIVE"),
+            ("ledger_entry", "ACCESS EXCLUSIVE"),
+            ("account", "SHARE ROW EXCLUSIVE"),
+        ],
+        "upgrade 0001 -> 0002": [("account", "ACCESS EXCLUSIVE")],
+        "upgrade 0002 -> 0003": [("ledger_entry", "SHARE UPDATE EXCLUSIVE")],
+        "upgrade 0003 -> 0004": [
+            ("refresh_token_p20260101", "ACCESS EXCLUSIVE"),
+            ("refresh_token", "ACCESS EXCLUSIVE"),
+        ],
+    }
+
+    assert report_locks(offline_sql) == expected
+
+
+@pytest.mark.parametrize(
+    ("statement", "locks"),
+    [
+        (
+            "ALTER TABLE ledger_entry ADD CONSTRAINT fk FOREIGN KEY(account_id) "
+            "REFERENCES account (id) NOT VALID;",
+            [
+                ("ledger_entry", "SHARE ROW EXCLUSIVE"),
+                ("account", "SHARE ROW EXCLUSIVE"),
+            ],
+        ),
+        (
+            "ALTER TABLE ledger_entry VALIDATE CONSTRAINT fk;",
+            [("ledger_entry", "SHARE UPDATE EXCLUSIVE")],
+        ),
+        (
+            "CREATE INDEX ix_account_currency ON account (currency);",
+            [("account", "SHARE")],
+        ),
+        (
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_account_currency;",
+            [("ix_account_currency", "SHARE UPDATE EXCLUSIVE")],
+        ),
+        (
+            "UPDATE account SET currency = 'USD';",
+            [("account", "ROW EXCLUSIVE")],
+        ),
+        ("SET lock_timeout = 0;", []),
+    ],
+)
+def test_statement_locks(statement: str, locks: List[Lock]) -> None:
+    assert statement_locks(statement) == locks
@@ -0,0 +1,257 @@
+import asyncio
+from collections import namedtuple
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+
+from simple_transactions.operation.services.velocity import checker as checker_module
+from simple_transactions.operation.services.velocity.checker import (
+    VelocityChecker,
+    VelocityLimitExceeded,
+)
+from simple_transactions.operation.services.velocity.window import WindowCounter
+from simple_transactions.operation.settings import VelocityRule
+
+Transfer = namedtuple("Transfer", ["id", "account_id", "created_at", "amount"])
+Bucket = namedtuple("Bucket", ["account_id", "epoch", "transfers", "amount"])
+
+
+class FakeLedger:
+    """Outgoing transfers served by the stubbed LedgerDAO."""
+
+    def __init__(self) -> None:
+        self.transfers: List[Transfer] = []
+
+    def post(self, account_id: int, created_at: float, amount: str) -> None:
+        self.transfers.append(
+            Transfer(len(self.transfers) + 1, account_id, created_at, Decimal(amount)),
+        )
+
+
+class FakeSession:
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def ledger(monkeypatch: pytest.MonkeyPatch) -> FakeLedger:
+    fake_ledger = FakeLedger()
+
+    class FakeLedgerDAO:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def get_last_entry_id(self) -> int:
+            return len(fake_ledger.transfers)
+
+        async def get_outgoing_buckets(
+            self,
+            account_ids: List[int],
+            since: float,
+            bucket_seconds: float,
+            until_id: int,
+        ) -> List[Bucket]:
+            return [
+                Bucket(
+                    transfer.account_id,
+                    int(transfer.created_at // bucket_seconds),
+                    1,
+                    transfer.amount,
+                )
+                for transfer in fake_ledger.transfers
+                if transfer.account_id in account_ids
+                and transfer.created_at >= since
+                and transfer.id <= until_id
+            ]
+
+        async def get_outgoing_transfers(
+            self,
+            account_ids: List[int],
+            after_id: int,
+            until_id: int,
+        ) -> List[Transfer]:
+            return [
+                transfer
+                for transfer in fake_ledger.transfers
+                if transfer.account_id in account_ids
+                and after_id < transfer.id <= until_id
+            ]
+
+    monkeypatch.setattr(checker_module, "LedgerDAO", FakeLedgerDAO)
+    return fake_ledger
+
+
+def make_checker(*rules: VelocityRule) -> VelocityChecker:
+    return VelocityChecker(rules, buckets=10, session_factory=FakeSession)
+
+
+def test_window_counter_expires_old_buckets() -> None:
+    counter = WindowCounter(size=3, epoch=0)
+    counter.add(0, 1, 100)
+    counter.add(1, 2, 50)
+
+    counter.advance(2)
+    assert (counter.count, counter.amount) == (3, 150)
+
+    counter.advance(3)
+    assert (counter.count, counter.amount) == (2, 50)
+
+    counter.advance(10)
+    assert (counter.count, counter.amount) == (0, 0)
+
+
+def test_window_counter_ignores_transfers_older_than_window() -> None:
+    counter = WindowCounter(size=3, epoch=5)
+    counter.add(2, 1, 100)
+    counter.add(3, 1, 10)
+
+    assert (counter.count, counter.amount) == (1, 10)
+
+
+def test_rules_with_same_window_count_transfer_once(ledger: FakeLedger) -> None:
+    checker = make_checker(
+        VelocityRule(name="count", window_seconds=60, max_count=2),
+        VelocityRule(name="amount", window_seconds=60, max_amount=Decimal(100)),
+    )
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(10), now=1000)
+        await checker.admit(1, Decimal(10), now=1001)
+        with pytest.raises(VelocityLimitExceeded) as exc_info:
+            await checker.admit(1, Decimal(10), now=1002)
+        assert exc_info.value.rule.name == "count"
+
+    asyncio.run(run())
+
+
+def test_amount_limit_counts_seeded_transfers(ledger: FakeLedger) -> None:
+    ledger.post(1, 990, "-90")
+    checker = make_checker(
+        VelocityRule(name="amount", window_seconds=60, max_amount=Decimal(100)),
+    )
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(10), now=1000)
+        with pytest.raises(VelocityLimitExceeded):
+            await checker.admit(1, Decimal("0.01"), now=1001)
+        await checker.admit(2, Decimal(100), now=1001)
+
+    asyncio.run(run())
+
+
+def test_window_slides_past_old_transfers(ledger: FakeLedger) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=1))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        with pytest.raises(VelocityLimitExceeded):
+            await checker.admit(1, Decimal(1), now=1030)
+        await checker.admit(1, Decimal(1), now=1070)
+
+    asyncio.run(run())
+
+
+def test_flush_merges_new_entries(ledger: FakeLedger) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=3))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        # Transfer of this worker and of another worker are committed.
+        ledger.post(1, 1000, "-1")
+        ledger.post(1, 1003, "-1")
+        await checker.flush(now=1005)
+        assert checker._windows[60][1].count == 2
+
+        # Already read entries are not merged again.
+        await checker.flush(now=1010)
+        assert checker._windows[60][1].count == 2
+
+    asyncio.run(run())
+
+
+def test_flush_keeps_transfers_counted_during_read(ledger: FakeLedger) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=5))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        ledger.post(1, 1000, "-1")
+        # Counted after the flush started, not in the ledger yet.
+        checker.record(1, 100, now=1006)
+        await checker.flush(now=1005)
+        assert checker._windows[60][1].count == 2
+
+    asyncio.run(run())
+
+
+def test_flush_keeps_uncommitted_transfers_for_one_more_flush(
+    ledger: FakeLedger,
+) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=5))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        await checker.admit(1, Decimal(2), now=1001)
+        # Neither transfer is committed when the ledger is read.
+        await checker.flush(now=1005)
+        assert checker._windows[60][1].count == 2
+
+        # The first one is committed, the second one is rolled back.
+        ledger.post(1, 1000, "-1")
+        await checker.flush(now=1010)
+        assert checker._windows[60][1].count == 1
+
+        await checker.flush(now=1015)
+        assert checker._windows[60][1].count == 1
+
+    asyncio.run(run())
+
+
+def test_seeding_counts_entries_after_watermark_once(ledger: FakeLedger) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=5))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        ledger.post(1, 1000, "-1")
+        # Posted through other workers after the watermark.
+        ledger.post(2, 1001, "-1")
+        ledger.post(2, 1002, "-1")
+        await checker.admit(2, Decimal(1), now=1003)
+        assert checker._windows[60][2].count == 3
+
+        await checker.flush(now=1005)
+        assert checker._windows[60][1].count == 1
+        assert checker._windows[60][2].count == 3
+
+    asyncio.run(run())
+
+
+def test_seeding_after_idle_period_counts_recent_entries(ledger: FakeLedger) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=2))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        ledger.post(1, 1000, "-1")
+        await checker.flush(now=1100)
+
+        for created_at in (5000, 5001, 5002):
+            ledger.post(2, created_at, "-1")
+        await checker.flush(now=5003)
+        with pytest.raises(VelocityLimitExceeded):
+            await checker.admit(2, Decimal(1), now=5004)
+
+    asyncio.run(run())
+
+
+def test_flush_forgets_idle_accounts(ledger: FakeLedger) -> None:
+    checker = make_checker(VelocityRule(name="count", window_seconds=60, max_count=5))
+
+    async def run() -> None:
+        await checker.admit(1, Decimal(1), now=1000)
+        await checker.flush(now=1100)
+        assert 1 not in checker._windows[60]
+
+    asyncio.run(run())
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+def _is_granted(waiter: "asyncio.Future[None]") -> bool:
+    return waiter.done() and not waiter.cancelled()
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit with a bounded wait queue.
+
+    The limit follows an additive increase / multiplicative decrease
+    rule driven by the average time requests wait for a pool connection.
+    """
+
+    def __init__(self, limit: int, min_limit: int, max_limit: int) -> None:
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Take a slot, waiting at most ``timeout`` seconds.
+
+        :param timeout: maximum time to wait in the queue.
+        :return: True if the slot was taken.
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            # The slot may be granted right before the timeout fires,
+            # in_flight already counts it, so keep it.
+            return _is_granted(waiter)
+        except asyncio.CancelledError:
+            if _is_granted(waiter):
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        return True
+
+    def release(self) -> None:
+        """Give the slot back and wake queued requests."""
+        self.in_flight -= 1
+        self._wake()
+
+    def adjust(self, pool_wait: float, target_pool_wait: float) -> None:
+        """
+        Update the limit from observed pool wait.
+
+        :param pool_wait: average time to get a pool connection.
+        :param target_pool_wait: pool wait considered healthy.
+        """
+        if pool_wait > target_pool_wait:
+            self.limit = max(self.min_limit, int(self.limit * 0.9))
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+            self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class AdmissionControlMiddleware:
+    """
+    Limits in-flight requests and sheds load under overload.
+
+    Requests are split into route classes, reads and writes, each with
+    its own adaptive limit. A request which can't get a slot within
+    ``queue_timeout`` seconds is rejected with 503 and ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        queue_timeout: float,
+        retry_after: int,
+        target_pool_wait: float,
+        adjust_interval: float = 1.0,
+        exempt_paths: Iterable[str] = ("/health",),
+    ) -> None:
+        self.app = app
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.target_pool_wait = target_pool_wait
+        self.adjust_interval = adjust_interval
+        self.exempt_paths = frozenset(exempt_paths)
+        self.limiters: Dict[str, AdaptiveLimiter] = {
+            route_class: AdaptiveLimiter(initial_limit, min_limit, max_limit)
+            for route_class in ("read", "write")
+        }
+        self._adjusted_at = time.monotonic()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = "read" if scope["method"] in READ_METHODS else "write"
+        limiter = self.limiters[route_class]
+        self._maybe_adjust(scope)
+
+        if not await limiter.acquire(self.queue_timeout):
+            response = JSONResponse(
+                {"detail": "Service is overloaded, retry later."},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    def _maybe_adjust(self, scope: Scope) -> None:
+        now = time.monotonic()
+        if now - self._adjusted_at < self.adjust_interval:
+            return
+        self._adjusted_at = now
+
+        engine = getattr(scope["app"].state, "db_engine", None)
+        if engine is None:
+            return
+        wait_time = getattr(engine.sync_engine.pool, "wait_time", None)
+        if wait_time is None:
+            return
+        for limiter in self.limiters.values():
+            limiter.adjust(wait_time.value, self.target_pool_wait)
@@ -0,0 +1,5 @@
+"""API for accounts."""
+
+from simple_transactions.operation.web.api.v1.accounts.views import router
+
+__all__ = ["router"]
@@ -0,0 +1,12 @@
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AccountBalanceDTO(BaseModel):
+    """DTO for account balance."""
+
+    id: int
+    currency: str
+    balance: Decimal
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+from starlette.requests import Request
+
+from simple_transactions.operation.db.dao.account_dao import AccountDAO
+from simple_transactions.operation.services.single_flight import SingleFlight
+from simple_transactions.operation.web.api.v1.accounts.schema import (
+    AccountBalanceDTO,
+)
+
+router = APIRouter()
+
+balance_flight: SingleFlight[Optional[AccountBalanceDTO]] = SingleFlight(
+    "account_balance",
+)
+
+
+@router.get("/{account_id}/balance", response_model=AccountBalanceDTO)
+async def get_account_balance(account_id: int, request: Request) -> AccountBalanceDTO:
+    """
+    Get current balance of an account.
+
+    Concurrent requests for the same account share one query.
+    The query uses its own session, so it isn't tied
+    to the request which happened to start it.
+
+    :param account_id: id of the account.
+    :param request: current request.
+    :raises HTTPException: if the account doesn't exist.
+    :return: account balance.
+    """
+
+    async def load_balance() -> Optional[AccountBalanceDTO]:
+        async with request.app.state.db_session_factory() as session:
+            account = await AccountDAO(session).get_account(account_id)
+        if account is None:
+            return None
+        return AccountBalanceDTO.model_validate(account)
+
+    balance = await balance_flight.do(account_id, load_balance)
+    if balance is None:
+        raise HTTPException(status_code=404, detail="Account not found.")
+    return balance
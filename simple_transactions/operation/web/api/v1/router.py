@@ -1,6 +1,8 @@
 from fastapi.routing import APIRouter
 
-from simple_transactions.operation.web.api.v1 import monitoring
+from simple_transactions.operation.web.api.v1 import accounts, monitoring, statements
 
 api_router = APIRouter()
 api_router.include_router(monitoring.router)
+api_router.include_router(statements.router, prefix="/statements", tags=["statements"])
+api_router.include_router(accounts.router, prefix="/accounts", tags=["accounts"])
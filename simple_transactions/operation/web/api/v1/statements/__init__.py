@@ -0,0 +1,5 @@
+"""API for account statement jobs."""
+
+from simple_transactions.operation.web.api.v1.statements.views import router
+
+__all__ = ["router"]
@@ -0,0 +1,39 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+
+class StatementJobInputDTO(BaseModel):
+    """DTO for submitting statement jobs."""
+
+    period_start: date
+    # Exclusive, the statement covers days before this one.
+    period_end: date
+
+    @model_validator(mode="after")
+    def check_period(self) -> "StatementJobInputDTO":
+        """
+        Check that the period is not empty.
+
+        :raises ValueError: if period ends before it starts.
+        :return: validated input.
+        """
+        if self.period_end <= self.period_start:
+            raise ValueError("period_end must be after period_start")
+        return self
+
+
+class StatementJobDTO(BaseModel):
+    """DTO for statement job status."""
+
+    id: int
+    period_start: date
+    period_end: date
+    status: str
+    total_chunks: Optional[int]
+    done_chunks: int
+    failed_attempts: int
+    error: Optional[str]
+    created_at: datetime
+    model_config = ConfigDict(from_attributes=True)
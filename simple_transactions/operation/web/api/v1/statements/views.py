@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from simple_transactions.operation.db.dao.statement_job_dao import StatementJobDAO
+from simple_transactions.operation.services.statements.dependency import (
+    get_statement_runner,
+)
+from simple_transactions.operation.services.statements.runner import (
+    StatementJobRunner,
+)
+from simple_transactions.operation.web.api.v1.statements.schema import (
+    StatementJobDTO,
+    StatementJobInputDTO,
+)
+
+router = APIRouter()
+
+
+@router.post("/jobs", response_model=StatementJobDTO, status_code=202)
+async def submit_statement_job(
+    job_input: StatementJobInputDTO,
+    job_dao: StatementJobDAO = Depends(),
+    runner: StatementJobRunner = Depends(get_statement_runner),
+) -> StatementJobDTO:
+    """
+    Submit job building statements of all accounts.
+
+    :param job_input: statement period.
+    :param job_dao: DAO for statement jobs.
+    :param runner: statement job runner.
+    :return: created job.
+    """
+    job = await job_dao.create_job(job_input.period_start, job_input.period_end)
+    # Commit before waking the runner, so it can see the job.
+    await job_dao.session.commit()
+    runner.wake()
+    return StatementJobDTO.model_validate(job)
+
+
+@router.get("/jobs/{job_id}", response_model=StatementJobDTO)
+async def get_statement_job(
+    job_id: int,
+    job_dao: StatementJobDAO = Depends(),
+) -> StatementJobDTO:
+    """
+    Get status of a statement job.
+
+    :param job_id: id of the job.
+    :param job_dao: DAO for statement jobs.
+    :raises HTTPException: if the job doesn't exist.
+    :return: job status.
+    """
+    job = await job_dao.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Statement job not found.")
+    return StatementJobDTO.model_validate(job)
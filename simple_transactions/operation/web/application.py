@@ -3,8 +3,11 @@ from importlib import metadata
 from fastapi import FastAPI
 from fastapi.responses import UJSONResponse
 
+from simple_transactions.operation.settings import settings
+from simple_transactions.operation.web.admission import AdmissionControlMiddleware
 from simple_transactions.operation.web.api.v1.router import api_router
 from simple_transactions.operation.web.lifespan import lifespan_setup
+from simple_transactions.operation.web.profiling import ProfilingMiddleware
 
 
 def get_app() -> FastAPI:
@@ -25,6 +28,21 @@ def get_app() -> FastAPI:
         default_response_class=UJSONResponse,
     )
 
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=settings.profiling_sample_rate,
+        header=settings.profiling_header,
+    )
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        initial_limit=settings.admission_initial_limit,
+        min_limit=settings.admission_min_limit,
+        max_limit=settings.admission_max_limit,
+        queue_timeout=settings.admission_queue_timeout,
+        retry_after=settings.admission_retry_after,
+        target_pool_wait=settings.admission_target_pool_wait,
+    )
+
     # Main router for the API.
     app.include_router(router=api_router, prefix="")
 
@@ -1,3 +1,5 @@
+import asyncio
+import importlib.util
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -7,13 +9,30 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from alembic import command
 from alembic.config import Config
 
-from simple_transactions.operation.settings import settings
+from simple_transactions.operation.db.pool import TimedAsyncAdaptedQueuePool
+from simple_transactions.operation.settings import HttpType, LoopType, settings
 
 from sqlalchemy import create_engine, text
 
 from loguru import logger
 
 from simple_transactions.operation.log import configure_logging
+from simple_transactions.operation.services.fx.lifespan import (
+    init_fx_rates,
+    shutdown_fx_rates,
+)
+from simple_transactions.operation.services.profiling.lifespan import (
+    init_profiling,
+    shutdown_profiling,
+)
+from simple_transactions.operation.services.statements.lifespan import (
+    init_statements,
+    shutdown_statements,
+)
+from simple_transactions.operation.services.velocity.lifespan import (
+    init_velocity,
+    shutdown_velocity,
+)
 
 
 def _test_db_connection():
@@ -26,6 +45,29 @@ def _test_db_connection():
         engine.dispose()
 
 
+def _log_server_setup() -> None:
+    """
+    Log event loop and HTTP parser actually used by the server.
+
+    With "auto" settings uvicorn silently falls back
+    to asyncio and h11 when uvloop or httptools are not installed.
+    """
+    loop_type = type(asyncio.get_running_loop())
+    http_type = settings.http
+    if http_type == HttpType.AUTO:
+        http_available = importlib.util.find_spec("httptools") is not None
+        http_type = HttpType.HTTPTOOLS if http_available else HttpType.H11
+    logger.info(
+        f"Running on {loop_type.__module__}.{loop_type.__name__} loop "
+        f"with {http_type.value} HTTP parser.",
+    )
+    uvloop_used = loop_type.__module__.startswith("uvloop")
+    if settings.loop == LoopType.AUTO and not uvloop_used:
+        logger.warning("uvloop is not installed, using asyncio event loop.")
+    if settings.http == HttpType.AUTO and http_type == HttpType.H11:
+        logger.warning("httptools is not installed, using h11 HTTP parser.")
+
+
 def _setup_db(app: FastAPI) -> None:  # pragma: no cover
     """
     Creates connection to the database.
@@ -36,7 +78,11 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    engine = create_async_engine(
+        str(settings.db_url),
+        echo=settings.db_echo,
+        poolclass=TimedAsyncAdaptedQueuePool,
+    )
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
@@ -67,12 +113,21 @@ async def lifespan_setup(
     :return: function that actually performs actions.
     """
     configure_logging()
+    _log_server_setup()
     app.middleware_stack = None
     _setup_db(app)
+    init_profiling(app)
     _test_db_connection()
     _run_migrations()
+    await init_fx_rates(app)
+    init_statements(app)
+    init_velocity(app)
 
     app.middleware_stack = app.build_middleware_stack()
 
     yield
+    await shutdown_velocity(app)
+    await shutdown_statements(app)
+    await shutdown_fx_rates(app)
+    await shutdown_profiling(app)
     await app.state.db_engine.dispose()
@@ -0,0 +1,52 @@
+import itertools
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from simple_transactions.operation.services.profiling.store import (
+    RequestProfile,
+    current_profile,
+)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles sampled requests.
+
+    A request is sampled if it has the profiling header
+    or if it is every ``sample_rate``-th request.
+    Profiles are saved to ``app.state.profiling``.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: int, header: str) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.header = header.lower().encode("latin-1")
+        self._counter = itertools.count(1)
+
+    def _is_sampled(self, scope: Scope) -> bool:
+        if self.sample_rate and next(self._counter) % self.sample_rate == 0:
+            return True
+        return any(name == self.header for name, _ in scope["headers"])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        store = getattr(scope["app"].state, "profiling", None)
+        if scope["type"] != "http" or store is None or not self._is_sampled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            method=scope["method"],
+            route=scope["path"],
+            loop_lag=store.loop_lag,
+        )
+        token = current_profile.set(profile)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profile.duration = time.perf_counter() - started_at
+            current_profile.reset(token)
+            route = scope.get("route")
+            profile.route = getattr(route, "path", profile.route)
+            store.add_profile(profile)